@@ -80,14 +80,17 @@ pub fn handle_event(layout: *Layout, idx: WidgetIdx, event: tk.Event) void {
     }
 }
 
-pub fn size(layout: *Layout, idx: WidgetIdx, _: Size.Minmax) Size {
-    const self = layout.data(idx, FontMap);
+pub fn natural_size(self: *const FontMap) Size {
     const font = self.font;
     const width = self.columns * (font.glyph_width + letter_padding);
     const height = self.rows() * (font.glyph_height + letter_padding);
     return Size{ .width = width, .height = height };
 }
 
+pub fn size(layout: *Layout, idx: WidgetIdx, _: Size.Minmax) Size {
+    return layout.data(idx, FontMap).natural_size();
+}
+
 const FontMap = @This();
 
 const tk = @import("toolkit");
@@ -84,6 +84,46 @@ pub fn font_map_handler(state: *State, idx: WidgetIdx, ev: *const anyopaque) voi
     state.set_value(.selected_glyph, event.code_point_clicked);
 }
 
+/// Lists every range of the font in a virtual scrollable
+const RangeList = struct {
+    const columns = 32;
+
+    ranges: [290]u32 = undefined,
+    len: u32 = 0,
+    font: *Font,
+
+    pub fn init(font: *Font) RangeList {
+        var list = RangeList{ .font = font };
+        var current_range: u32 = 0;
+        while (find_next_range(font, current_range, false)) |range| {
+            current_range = range;
+            list.ranges[list.len] = range;
+            list.len += 1;
+        }
+        return list;
+    }
+
+    pub fn extent(list: *const RangeList) u31 {
+        const font_map = FontMap{ .columns = columns, .font = list.font };
+        return font_map.natural_size().height;
+    }
+
+    pub fn count(list: *RangeList) u32 {
+        return list.len;
+    }
+
+    pub fn build(list: *RangeList, layout: *Layout) WidgetIdx {
+        return layout.add2(.font_map, .{
+            .columns = columns,
+            .font = list.font,
+        });
+    }
+
+    pub fn bind(list: *RangeList, layout: *Layout, slot: WidgetIdx, index: u32) void {
+        layout.data(slot, FontMap).selected_range = list.ranges[index];
+    }
+};
+
 const State = Signal(struct {
     selected_range: u32,
     selected_glyph: u21,
@@ -100,6 +140,7 @@ pub fn main(init: std.process.Init) !void {
     try layout.init(app.client.allocator);
 
     var popup_handler: PopupHandler = undefined;
+    var range_list = RangeList.init(app.font);
     var menu_handler: MenuHandler = undefined;
 
     var s = State.init(layout, allocator);
@@ -130,26 +171,10 @@ pub fn main(init: std.process.Init) !void {
             .font = app.font,
         });
 
-        const scrollable = s: {
-            var btns: [290]WidgetIdx = undefined;
-            var current_range: u32 = 0;
-            var i: u32 = 0;
-            while (find_next_range(app.font, current_range, false)) |range| {
-                current_range = range;
-                btns[i] = layout.add2(.font_map, .{
-                    .columns = 32,
-                    .font = app.font,
-                    .selected_range = range,
-                });
-                i += 1;
-            }
-            const subflex = layout.add2(.flex, .{ .orientation = .vertical });
-
-            const scrollable = layout.add4(.scrollable, .{ .content = subflex });
-            layout.set(subflex, .children, btns[0..i]);
-            layout.set(scrollable, .flex, 1);
-            break :s scrollable;
-        };
+        const scrollable = layout.add4(.scrollable, .{
+            .source = Scrollable.DataSource.init(&range_list, range_list.extent()),
+        });
+        layout.set(scrollable, .flex, 1);
 
         layout.set_handler2(font_map, &font_map_handler, &s);
         layout.set(flex, .children, &.{
@@ -196,6 +221,7 @@ const std = @import("std");
 const FontMap = @import("FontMap.zig");
 const GlyphView = @import("GlyphView.zig");
 const Signal = @import("signals.zig").Signal;
+const Scrollable = widget.WidgetData(.scrollable);
 
 const wlnd = @import("wayland");
 const tk = @import("toolkit");
@@ -0,0 +1,68 @@
+//! Timings collected by a benchmark, written as JSON so runs on different
+//! commits can be compared. The output path is the first command line
+//! argument, `zig-out/bench/<benchmark>.json` by default.
+
+benchmark: []const u8,
+results: std.ArrayListUnmanaged(Result) = .empty,
+
+pub const Result = struct {
+    name: []const u8,
+    iterations: u64,
+    ns_per_iter: u64,
+    /// Widgets, messages, bytes... handled by one iteration
+    items_per_iter: u64,
+};
+
+pub fn deinit(self: *Results, gpa: std.mem.Allocator) void {
+    self.results.deinit(gpa);
+}
+
+/// Records the time since `start` and prints it.
+pub fn record(
+    self: *Results,
+    gpa: std.mem.Allocator,
+    io: std.Io,
+    name: []const u8,
+    start: std.Io.Timestamp,
+    iterations: u64,
+    items_per_iter: u64,
+) !void {
+    const elapsed: u64 = @intCast(start.untilNow(io, .awake).toNanoseconds());
+    const result: Result = .{
+        .name = name,
+        .iterations = iterations,
+        .ns_per_iter = elapsed / iterations,
+        .items_per_iter = items_per_iter,
+    };
+    try self.results.append(gpa, result);
+    std.debug.print("{s:<20} {d:>10} ns/iter {d:>8} ns/item\n", .{
+        name,
+        result.ns_per_iter,
+        result.ns_per_iter / @max(items_per_iter, 1),
+    });
+}
+
+pub fn write(self: *const Results, init: std.process.Init) !void {
+    const arena = init.arena.allocator();
+    const args = try init.minimal.args.toSlice(arena);
+    const path = if (args.len > 1)
+        args[1]
+    else
+        try std.fmt.allocPrint(arena, "zig-out/bench/{s}.json", .{self.benchmark});
+
+    var out: std.Io.Writer.Allocating = .init(arena);
+    try std.json.Stringify.value(.{
+        .benchmark = self.benchmark,
+        .results = self.results.items,
+    }, .{ .whitespace = .indent_2 }, &out.writer);
+    try out.writer.writeByte('\n');
+
+    const cwd = std.Io.Dir.cwd();
+    if (std.fs.path.dirname(path)) |dir| try cwd.createDirPath(init.io, dir);
+    try cwd.writeFile(init.io, .{ .sub_path = path, .data = out.written() });
+    std.debug.print("wrote {s}\n", .{path});
+}
+
+const std = @import("std");
+
+const Results = @This();
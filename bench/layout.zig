@@ -0,0 +1,80 @@
+//! Times `Layout.set_size` on deep trees of nested `Flex` widgets.
+//!
+//! zig build bench-layout -Doptimize=ReleaseFast
+
+const depth = 9;
+const branching = 2;
+const iterations = 2000;
+
+fn add_tree(layout: *Layout, arena: std.mem.Allocator, level: u32) !WidgetIdx {
+    if (level == depth) return layout.add2(.label, .{});
+
+    const children = try arena.alloc(WidgetIdx, branching);
+    for (children, 0..) |*child, i| {
+        child.* = try add_tree(layout, arena, level + 1);
+        // Mix flex and non-flex children so both passes of `Flex.size` run
+        if (i % 2 == 1) layout.set(child.*, .flex, 1);
+    }
+    const orientation: @FieldType(Flex, "orientation") = if (level % 2 == 0) .horizontal else .vertical;
+    const flex = layout.add2(.flex, .{ .orientation = orientation });
+    layout.set(flex, .children, children);
+    return flex;
+}
+
+pub fn main(init: std.process.Init) !void {
+    const io = init.io;
+    const gpa = init.gpa;
+
+    var layout = Layout{};
+    try layout.init(gpa);
+    defer layout.deinit(gpa);
+    try layout.widgets.ensureTotalCapacity(gpa, 2 << depth);
+
+    const root = try add_tree(&layout, init.arena.allocator(), 0);
+    const leaf: WidgetIdx = @enumFromInt(0);
+    const widgets = layout.widgets.len;
+    const size: Size = .{ .width = 1920, .height = 1080 };
+
+    var results: Results = .{ .benchmark = "layout" };
+    defer results.deinit(gpa);
+
+    std.debug.print("{d} widgets, depth {d}\n", .{ widgets, depth });
+
+    var start = std.Io.Timestamp.now(io, .awake);
+    for (0..iterations) |_| {
+        @memset(layout.widgets.items(.layout_dirty), true);
+        layout.set_size(root, .tight(size));
+    }
+    try results.record(gpa, io, "full", start, iterations, widgets);
+
+    start = std.Io.Timestamp.now(io, .awake);
+    for (0..iterations) |i| {
+        const resized: Size = .{ .width = size.width + @as(u31, @intCast(i % 64)), .height = size.height };
+        layout.set_size(root, .tight(resized));
+    }
+    try results.record(gpa, io, "resize", start, iterations, widgets);
+
+    start = std.Io.Timestamp.now(io, .awake);
+    for (0..iterations) |_| {
+        layout.set_size(root, .tight(size));
+    }
+    try results.record(gpa, io, "unchanged", start, iterations, widgets);
+
+    start = std.Io.Timestamp.now(io, .awake);
+    for (0..iterations) |_| {
+        layout.request_layout(leaf);
+        layout.set_size(root, .tight(size));
+    }
+    try results.record(gpa, io, "leaf", start, iterations, widgets);
+
+    try results.write(init);
+}
+
+const std = @import("std");
+const Results = @import("Results.zig");
+
+const tk = @import("toolkit");
+const Size = tk.Size;
+const Layout = tk.Layout;
+const WidgetIdx = tk.widget.WidgetIdx;
+const Flex = tk.widget.WidgetData(.flex);
@@ -0,0 +1,234 @@
+//! Times the protocol path: `Argument` encoding and decoding, the connection
+//! ring buffers and `Client.consumeEvents` dispatching recorded event streams.
+//!
+//! zig build bench-protocol -Doptimize=ReleaseFast
+
+pub const std_options: std.Options = .{ .log_level = .info };
+
+const iterations = 20000;
+
+/// One argument of each type sent on the wire, in the proportions of a typical session
+const sample_args = [_]Argument{
+    .{ .uint = 1 },
+    .{ .uint = 4321 },
+    .{ .int = -12 },
+    .{ .object = 3 },
+    .{ .new_id = 7 },
+    .{ .fixed = .fromDouble(120.5) },
+    .{ .fixed = .fromDouble(-3.25) },
+    .{ .string = "wl_compositor" },
+    .{ .string = "zwlr_layer_shell_v1" },
+    .{ .array = .{ .size = 6, .alloc = 8, .data = @constCast(&[_]u8{ 30, 31, 32, 33, 34, 35 }) } },
+};
+
+fn Counter(comptime T: type) type {
+    return struct {
+        fn listener(_: *Client, _: T, _: T.Event, count: *u64) void {
+            count.* += 1;
+        }
+    };
+}
+
+fn opcode(comptime T: type, comptime event: std.meta.Tag(T.Event)) u16 {
+    return @intFromEnum(event);
+}
+
+/// Writes an event the way the compositor sends it.
+fn message(out: *std.Io.Writer, id: anytype, op: u16, args: []const Argument) !void {
+    var size: u16 = 8;
+    for (args) |arg| size += arg.len();
+    try out.writeInt(u32, @intFromEnum(id), .little);
+    try out.writeInt(u16, op, .little);
+    try out.writeInt(u16, size, .little);
+    for (args) |*arg| try arg.marshal(out);
+}
+
+const Objects = struct {
+    registry: wl.Registry = @enumFromInt(2),
+    pointer: wl.Pointer = @enumFromInt(3),
+    keyboard: wl.Keyboard = @enumFromInt(4),
+    surface: u32 = 5,
+};
+
+/// Globals advertised after `get_registry`
+fn record_registry(out: *std.Io.Writer, o: Objects) !u64 {
+    const names = [_][:0]const u8{
+        "wl_compositor",    "wl_shm",                     "wl_seat",                    "wl_output",
+        "xdg_wm_base",      "zwlr_layer_shell_v1",        "wp_viewporter",              "wl_data_device_manager",
+        "wl_subcompositor", "wp_cursor_shape_manager_v1", "zxdg_decoration_manager_v1", "wp_fractional_scale_manager_v1",
+    };
+    for (names, 1..) |name, i| {
+        try message(out, o.registry, opcode(wl.Registry, .global), &.{
+            .{ .uint = @intCast(i) },
+            .{ .string = name },
+            .{ .uint = 4 },
+        });
+    }
+    return names.len;
+}
+
+/// Pointer moved across a surface, one `frame` per motion
+fn record_pointer(out: *std.Io.Writer, o: Objects) !u64 {
+    const motions = 40;
+    try message(out, o.pointer, opcode(wl.Pointer, .enter), &.{
+        .{ .uint = 1 },
+        .{ .object = o.surface },
+        .{ .fixed = .fromInt(0) },
+        .{ .fixed = .fromInt(0) },
+    });
+    for (0..motions) |i| {
+        try message(out, o.pointer, opcode(wl.Pointer, .motion), &.{
+            .{ .uint = @intCast(i * 8) },
+            .{ .fixed = .fromDouble(@floatFromInt(i)) },
+            .{ .fixed = .fromDouble(@as(f64, @floatFromInt(i)) / 2) },
+        });
+        try message(out, o.pointer, opcode(wl.Pointer, .frame), &.{});
+    }
+    try message(out, o.pointer, opcode(wl.Pointer, .button), &.{
+        .{ .uint = 2 }, .{ .uint = 400 }, .{ .uint = 0x110 }, .{ .uint = 1 },
+    });
+    try message(out, o.pointer, opcode(wl.Pointer, .frame), &.{});
+    try message(out, o.pointer, opcode(wl.Pointer, .leave), &.{
+        .{ .uint = 3 },
+        .{ .object = o.surface },
+    });
+    return 2 * motions + 4;
+}
+
+/// Keyboard focus followed by typing
+fn record_keyboard(out: *std.Io.Writer, o: Objects) !u64 {
+    const keys = 30;
+    const pressed = [_]u32{ 29, 42 };
+    try message(out, o.keyboard, opcode(wl.Keyboard, .enter), &.{
+        .{ .uint = 1 },
+        .{ .object = o.surface },
+        .{ .array = .{ .size = @sizeOf(@TypeOf(pressed)), .alloc = @sizeOf(@TypeOf(pressed)), .data = @constCast(&pressed) } },
+    });
+    for (0..keys) |i| {
+        const key: u32 = @intCast(16 + i % 10);
+        for ([_]u32{ 1, 0 }) |state| {
+            try message(out, o.keyboard, opcode(wl.Keyboard, .key), &.{
+                .{ .uint = @intCast(i) }, .{ .uint = @intCast(i * 30) }, .{ .uint = key }, .{ .uint = state },
+            });
+        }
+        try message(out, o.keyboard, opcode(wl.Keyboard, .modifiers), &.{
+            .{ .uint = @intCast(i) }, .{ .uint = 0 }, .{ .uint = 0 }, .{ .uint = 0 }, .{ .uint = 0 },
+        });
+    }
+    return 3 * keys + 1;
+}
+
+/// Feeds `stream` to the connection in chunks as large as the ring buffer
+/// allows, like `recvmsg` would, and dispatches the complete messages.
+fn replay(client: *Client, stream: []const u8) !void {
+    const in = &client.connection.in;
+    var rest = stream;
+    while (rest.len > 0) {
+        const n = @min(rest.len, in.free_space());
+        try in.pushSlice(rest[0..n]);
+        rest = rest[n..];
+        if (in.count >= 8) try client.consumeEvents();
+    }
+    // A partial message left over means the stream or the parser is wrong
+    if (in.count != 0) return error.TrailingBytes;
+}
+
+pub fn main(init: std.process.Init) !void {
+    const io = init.io;
+    const gpa = init.gpa;
+
+    var results: Results = .{ .benchmark = "protocol" };
+    defer results.deinit(gpa);
+
+    // Argument
+    var encoded: [256]u8 align(4) = undefined;
+    var writer = std.Io.Writer.fixed(&encoded);
+    var start = std.Io.Timestamp.now(io, .awake);
+    for (0..iterations) |_| {
+        writer.end = 0;
+        for (&sample_args) |*arg| try arg.marshal(&writer);
+        std.mem.doNotOptimizeAway(writer.end);
+    }
+    try results.record(gpa, io, "marshal", start, iterations, sample_args.len);
+
+    const wire = writer.buffered();
+    start = std.Io.Timestamp.now(io, .awake);
+    for (0..iterations) |_| {
+        var data: []const u8 = wire;
+        for (sample_args) |arg| {
+            const decoded = Argument.unmarshal(arg, gpa, data);
+            std.mem.doNotOptimizeAway(decoded);
+            data = data[decoded.len()..];
+        }
+    }
+    try results.record(gpa, io, "unmarshal", start, iterations, sample_args.len);
+
+    // RingBuffer
+    var ring: RingBuffer(1024) = .{};
+    const chunk = wire[0..48];
+    start = std.Io.Timestamp.now(io, .awake);
+    for (0..iterations) |_| {
+        for (0..16) |_| try ring.pushSlice(chunk);
+        std.mem.doNotOptimizeAway(ring.get_read_iovecs());
+        ring.consume(ring.count);
+    }
+    try results.record(gpa, io, "ring_push_consume", start, iterations, 16 * chunk.len);
+
+    start = std.Io.Timestamp.now(io, .awake);
+    for (0..iterations) |_| {
+        for (0..64) |i| try ring.writer.writeInt(u32, @intCast(i), .little);
+        ring.consume(ring.count);
+    }
+    try results.record(gpa, io, "ring_writer", start, iterations, 64 * 4);
+
+    // Client.consumeEvents
+    var connection: Connection = .{ .socket_fd = -1, .client = undefined };
+    var client: Client = .{
+        .wl_display = @enumFromInt(1),
+        .connection = &connection,
+        .allocator = gpa,
+    };
+    connection.client = &client;
+    defer client.objects.deinit(gpa);
+    defer client.listeners.deinit(gpa);
+
+    const o: Objects = .{};
+    try client.objects.append(gpa, .{ .interface = wl.Display.id, .is_free = true });
+    try client.objects.append(gpa, .{ .interface = wl.Display.id });
+    try client.objects.append(gpa, .{ .interface = wl.Registry.id });
+    try client.objects.append(gpa, .{ .interface = wl.Pointer.id });
+    try client.objects.append(gpa, .{ .interface = wl.Keyboard.id });
+    var dispatched: u64 = 0;
+    client.set_listener(o.registry, *u64, Counter(wl.Registry).listener, &dispatched);
+    client.set_listener(o.pointer, *u64, Counter(wl.Pointer).listener, &dispatched);
+    client.set_listener(o.keyboard, *u64, Counter(wl.Keyboard).listener, &dispatched);
+
+    const streams = .{
+        .{ "consume_registry", record_registry },
+        .{ "consume_pointer", record_pointer },
+        .{ "consume_keyboard", record_keyboard },
+    };
+    inline for (streams) |stream| {
+        var recorded: std.Io.Writer.Allocating = .init(gpa);
+        defer recorded.deinit();
+        const messages = try stream[1](&recorded.writer, o);
+
+        dispatched = 0;
+        start = std.Io.Timestamp.now(io, .awake);
+        for (0..iterations) |_| try replay(&client, recorded.written());
+        if (dispatched != iterations * messages) return error.MissedEvents;
+        try results.record(gpa, io, stream[0], start, iterations, messages);
+    }
+
+    try results.write(init);
+}
+
+const std = @import("std");
+const Results = @import("Results.zig");
+
+const wayland = @import("wayland");
+const wl = wayland.wl;
+const Argument = wayland.Argument;
+const Client = wayland.Client;
+const Connection = wayland.Connection;
+const RingBuffer = wayland.RingBuffer;
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# pyright: strict
+"""Times the phases of `wayland/scanner.py` (parse, resolve, emit, format) over
+the bundled protocols and over a synthetic corpus of 500 interfaces.
+
+python bench/scanner.py [output.json]
+
+Results are written as JSON, `zig-out/bench/scanner.json` by default. `zig fmt`
+is looked up as `$ZIG`, then `zig`; the format phase is skipped without it.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Callable
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'wayland'))
+import scanner  # noqa: E402
+from scanner import Namespace, Protocol  # noqa: E402
+
+RUNS = 5
+SYNTHETIC_INTERFACES = 500
+SYNTHETIC_PROTOCOLS = [('bench', 3), ('synth', 2)]
+
+
+def synthetic_protocol(prefix: str, first: int, count: int, other: str) -> str:
+    """Interfaces using every argument type, with constructors and enums local
+    to the protocol and object arguments pointing into `other`."""
+    out = io.StringIO()
+    out.write(f'<protocol name="{prefix}_{first}">\n')
+    out.write('<copyright>Synthetic benchmark protocol</copyright>\n')
+    for n in range(first, first + count):
+        child = n + 1 if n + 1 < first + count else first
+        out.write(
+            f'''\
+<interface name="{prefix}_iface{n}" version="3">
+  <description summary="interface {n}">Synthetic interface {n}.</description>
+  <enum name="error">
+    <entry name="invalid_state" value="0" summary="invalid state"/>
+    <entry name="invalid_size" value="1" summary="invalid size"/>
+    <entry name="defunct" value="2" summary="defunct"/>
+  </enum>
+  <enum name="flags" bitfield="true">
+    <entry name="none" value="0"/>
+    <entry name="active" value="1"/>
+    <entry name="maximized" value="2"/>
+    <entry name="resizing" value="4"/>
+    <entry name="tiled" value="8"/>
+  </enum>
+  <request name="destroy" type="destructor">
+    <description summary="destroy">Destroys the object.</description>
+  </request>
+  <request name="create_child">
+    <arg name="id" type="new_id" interface="{prefix}_iface{child}"/>
+    <arg name="parent" type="object" interface="{other}_iface0" allow-null="true"/>
+  </request>
+  <request name="set_state">
+    <arg name="x" type="int"/>
+    <arg name="flags" type="uint" enum="flags"/>
+    <arg name="scale" type="fixed"/>
+    <arg name="title" type="string"/>
+    <arg name="data" type="array"/>
+    <arg name="fd" type="fd"/>
+    <arg name="peer" type="object" interface="{prefix}_iface{child}"/>
+  </request>
+  <event name="configure">
+    <arg name="serial" type="uint"/>
+    <arg name="width" type="int"/>
+    <arg name="height" type="int"/>
+    <arg name="flags" type="uint" enum="flags"/>
+    <arg name="error" type="uint" enum="{prefix}_iface{first}.error"/>
+  </event>
+  <event name="name">
+    <arg name="name" type="string" allow-null="true"/>
+  </event>
+  <event name="child">
+    <arg name="child" type="object" interface="{prefix}_iface{child}"/>
+    <arg name="keys" type="array"/>
+  </event>
+</interface>
+'''
+        )
+    out.write('</protocol>\n')
+    return out.getvalue()
+
+
+def write_synthetic(dir: Path) -> list[Path]:
+    files: list[Path] = []
+    per_file = SYNTHETIC_INTERFACES // sum(n for _, n in SYNTHETIC_PROTOCOLS)
+    prefixes = [p for p, _ in SYNTHETIC_PROTOCOLS]
+    for i, (prefix, n) in enumerate(SYNTHETIC_PROTOCOLS):
+        other = prefixes[(i + 1) % len(prefixes)]
+        for f in range(n):
+            path = dir / f'{prefix}-{f}.xml'
+            path.write_text(synthetic_protocol(prefix, f * per_file, per_file, other))
+            files.append(path)
+    return files
+
+
+def timed(timings: dict[str, list[int]], phase: str, fn: Callable[[], None]):
+    start = time.perf_counter_ns()
+    fn()
+    timings.setdefault(phase, []).append(time.perf_counter_ns() - start)
+
+
+def run_corpus(files: list[Path], out_dir: Path, zig: str | None) -> tuple[int, dict[str, list[int]]]:
+    timings: dict[str, list[int]] = {}
+    interfaces = 0
+    for _ in range(RUNS):
+        Namespace.instances.clear()
+        protocols: list[Protocol] = []
+
+        def parse():
+            for f in files:
+                p = Protocol(f)
+                Namespace.get(p.prefix).protocols.append(p)
+                protocols.append(p)
+
+        def resolve():
+            for p in protocols:
+                p.resolve()
+
+        outputs: dict[str, str] = {}
+
+        def emit():
+            for ns in Namespace.instances.values():
+                buf = io.StringIO()
+                ns.emit(buf)
+                outputs[ns.name] = buf.getvalue()
+            buf = io.StringIO()
+            scanner.emit_interface_ids(list(Namespace.instances.values()), buf)
+            outputs['interfaces'] = buf.getvalue()
+
+        timed(timings, 'parse', parse)
+        timed(timings, 'resolve', resolve)
+        timed(timings, 'emit', emit)
+        interfaces = sum(len(p.interfaces) for p in protocols)
+
+        if zig:
+            paths = [out_dir / f'{name}.zig' for name in outputs]
+            for path, text in zip(paths, outputs.values()):
+                path.write_text(text)
+            timed(
+                timings,
+                'format',
+                lambda: subprocess.run([zig, 'fmt', *map(str, paths)], check=True, stdout=subprocess.DEVNULL),
+            )
+
+    return interfaces, timings
+
+
+def main():
+    output = Path(sys.argv[1] if len(sys.argv) > 1 else 'zig-out/bench/scanner.json')
+    zig = shutil.which(os.environ.get('ZIG', 'zig'))
+    if not zig:
+        print('zig not found, skipping the format phase', file=sys.stderr)
+
+    results: list[dict[str, str | int]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        corpora = {'synthetic': write_synthetic(tmp)}
+        missing = [str(p) for p in scanner.XML_PROTOCOLS if not p.exists()]
+        if missing:
+            print(f'skipping bundled protocols, missing: {", ".join(missing)}', file=sys.stderr)
+        else:
+            corpora['bundled'] = scanner.XML_PROTOCOLS
+
+        for corpus, files in corpora.items():
+            interfaces, timings = run_corpus(files, tmp, zig)
+            for phase, ns in timings.items():
+                ns_per_iter = int(statistics.median(ns))
+                name = f'{corpus}/{phase}'
+                results.append(
+                    {
+                        'name': name,
+                        'iterations': len(ns),
+                        'ns_per_iter': ns_per_iter,
+                        'items_per_iter': interfaces,
+                    }
+                )
+                print(f'{name:<20} {ns_per_iter:>10} ns/iter {ns_per_iter // interfaces:>8} ns/item', file=sys.stderr)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({'benchmark': 'scanner', 'results': results}, indent=2) + '\n')
+    print(f'wrote {output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
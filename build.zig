@@ -14,7 +14,6 @@ pub fn build(b: *std.Build) void {
             .{ .name = "wayland", .module = wayland },
         },
     });
-    _ = toolkit; // autofix
 
     inline for (.{ "globals", "seats", "hello", "kb_grab", "animation" }) |example| {
         const exe = b.addExecutable(.{
@@ -42,6 +41,33 @@ pub fn build(b: *std.Build) void {
         const run_step = b.step("run-" ++ example, "Run the app");
         run_step.dependOn(&run_cmd.step);
     }
+    const bench_step = b.step("bench", "Run all benchmarks");
+    inline for (.{ "layout", "protocol" }) |bench| {
+        const exe = b.addExecutable(.{
+            .name = "bench-" ++ bench,
+            .root_module = b.createModule(.{
+                .root_source_file = b.path("bench/" ++ bench ++ ".zig"),
+                .target = target,
+                .optimize = optimize,
+            }),
+        });
+        exe.root_module.addImport("toolkit", toolkit);
+        exe.root_module.addImport("wayland", wayland);
+
+        const run_cmd = b.addRunArtifact(exe);
+        run_cmd.addArg(b.getInstallPath(.prefix, "bench/" ++ bench ++ ".json"));
+        const run_step = b.step("bench-" ++ bench, "Run the " ++ bench ++ " benchmark");
+        run_step.dependOn(&run_cmd.step);
+        bench_step.dependOn(&run_cmd.step);
+    }
+    {
+        const run_cmd = b.addSystemCommand(&.{"python3"});
+        run_cmd.addFileArg(b.path("bench/scanner.py"));
+        run_cmd.addArg(b.getInstallPath(.prefix, "bench/scanner.json"));
+        const run_step = b.step("bench-scanner", "Run the scanner benchmark");
+        run_step.dependOn(&run_cmd.step);
+        bench_step.dependOn(&run_cmd.step);
+    }
     {
         const unit_tests = b.addTest(.{
             .root_module = b.createModule(.{
@@ -52,8 +78,19 @@ pub fn build(b: *std.Build) void {
         });
         unit_tests.root_module.addImport("wayland", wayland);
 
+        const toolkit_tests = b.addTest(.{
+            .root_module = b.createModule(.{
+                .root_source_file = b.path("toolkit/toolkit.zig"),
+                .target = target,
+                .optimize = optimize,
+            }),
+        });
+        toolkit_tests.root_module.addImport("wayland", wayland);
+
         const run_unit_tests = b.addRunArtifact(unit_tests);
+        const run_toolkit_tests = b.addRunArtifact(toolkit_tests);
         const test_step = b.step("test", "Run unit tests");
         test_step.dependOn(&run_unit_tests.step);
+        test_step.dependOn(&run_toolkit_tests.step);
     }
 }
@@ -26,7 +26,9 @@ surfaces: std.AutoHashMapUnmanaged(wl.Surface, Surface) = .{},
 active_surface: ?wl.Surface = null,
 
 layout: Layout = .{},
+hit_index: HitIndex = .{},
 pointer_position: Point = Point.ZERO,
+pointer_frames: PointerFrames = .{},
 
 pub fn new(alloc: std.mem.Allocator, environ_map: *std.process.Environ.Map) !*App {
     const client = try wlnd.Client.connect(alloc, environ_map);
@@ -54,6 +56,7 @@ pub fn deinit(app: *App) void {
     const alloc = app.client.allocator;
     app.client.deinit();
     app.layout.deinit(alloc);
+    app.hit_index.deinit(alloc);
     app.font.deinit(alloc);
     alloc.destroy(app.font);
     app.surfaces.deinit(alloc);
@@ -77,8 +80,8 @@ pub fn new_common(app: *App, root_widget: WidgetIdx) !*Surface {
     const result = try app.surfaces.getOrPut(app.client.allocator, wl_surface);
     const surf = result.value_ptr;
 
-    const size = app.layout.call(root_widget, .size, .{Size.Minmax.ZERO});
-    app.layout.set(root_widget, .rect, size.to_rect());
+    app.layout.set_size(root_widget, Size.Minmax.ZERO);
+    const size = app.layout.get(root_widget, .rect).get_size();
     surf.* = .{
         .app = app,
         .wl_surface = wl_surface,
@@ -183,49 +186,152 @@ fn seat_listener(client: *wlnd.Client, seat: wl.Seat, event: wl.Seat.Event, app:
     }
 }
 
-fn pointer_listener(client: *wlnd.Client, _: wl.Pointer, _event: wl.Pointer.Event, app: *App) void {
-    var event: ?Event.PointerEvent = switch (_event) {
-        .enter => |ev| blk: {
+/// Groups the motion, button and axis events a seat sends between
+/// `wl_pointer.frame` events, so each group is handled once.
+const PointerFrames = struct {
+    pending: Frame = .{},
+    /// `pending` ends at a `wl_pointer.frame` and is only waiting for the frame callback
+    closed: bool = false,
+    /// Set once the seat sends `wl_pointer.frame`, until then events are dispatched as they arrive
+    seat_sends_frames: bool = false,
+
+    const Frame = struct {
+        position: ?Point = null,
+        /// Sums of the axis values per axis, in wl_fixed units
+        vertical_scroll: ?i32 = null,
+        horizontal_scroll: ?i32 = null,
+        buttons: [4]@FieldType(wl.Pointer.Event, "button") = undefined,
+        button_count: u8 = 0,
+    };
+
+    /// Adds a motion, button, axis or frame event and returns the events to
+    /// dispatch now, if any. Motion and scrolling are held back at a frame
+    /// when `can_defer`, to be taken by `take_closed` once per redraw.
+    fn add(self: *PointerFrames, event: wl.Pointer.Event, can_defer: bool) ?Frame {
+        var ready: ?Frame = null;
+        const frame = &self.pending;
+        if (event != .frame) self.closed = false;
+        switch (event) {
+            .motion => |ev| {
+                frame.position = Point{ .x = @abs(ev.surface_x.toInt()), .y = @abs(ev.surface_y.toInt()) };
+            },
+            .button => |ev| {
+                if (frame.button_count == frame.buttons.len) ready = self.take();
+                frame.buttons[frame.button_count] = ev;
+                frame.button_count += 1;
+            },
+            .axis => |ev| switch (ev.axis) {
+                inline else => |axis| {
+                    const sum = &@field(frame, @tagName(axis));
+                    sum.* = (sum.* orelse 0) +| @intFromEnum(ev.value);
+                },
+            },
+            .frame => {
+                self.seat_sends_frames = true;
+                self.closed = true;
+                if (frame.button_count > 0 or !can_defer) return self.take();
+            },
+            else => {},
+        }
+        // Seats older than version 5 do not send frame events
+        if (!self.seat_sends_frames) return self.take();
+        return ready;
+    }
+
+    /// Returns the pending events if they end at a `wl_pointer.frame`.
+    fn take_closed(self: *PointerFrames) ?Frame {
+        return if (self.closed) self.take() else null;
+    }
+
+    /// Returns the pending events, complete or not.
+    fn take(self: *PointerFrames) ?Frame {
+        const frame = self.pending;
+        self.pending = .{};
+        self.closed = false;
+        if (frame.position == null and frame.button_count == 0 and
+            frame.vertical_scroll == null and frame.horizontal_scroll == null) return null;
+        return frame;
+    }
+};
+
+fn pointer_listener(_: *wlnd.Client, _: wl.Pointer, event: wl.Pointer.Event, app: *App) void {
+    switch (event) {
+        .enter => |ev| {
             std.log.info("ENter  - {}", .{ev});
+            if (app.pointer_frames.take()) |frame| app.dispatch_pointer_frame(frame);
             app.pointer_position = Point{ .x = @abs(ev.surface_x.toInt()), .y = @abs(ev.surface_y.toInt()) };
             app.pointer_enter_serial = ev.serial;
             app.active_surface = ev.surface;
-            break :blk null;
-        },
-        .motion => |ev| blk: {
-            app.pointer_position = Point{ .x = @abs(ev.surface_x.toInt()), .y = @abs(ev.surface_y.toInt()) };
-            break :blk null;
+            app.dispatch_pointer_event(null);
         },
-        .leave => blk: {
+        .leave => {
+            if (app.pointer_frames.take()) |frame| app.dispatch_pointer_frame(frame);
             app.pointer_position = Point.INF;
             @memset(app.layout.widgets.items(.pressed), false);
-            break :blk .{ .leave = {} };
-        },
-        .button => |ev| blk: {
-            break :blk .{ .button = .{ .button = @enumFromInt(ev.button), .state = ev.state, .pos = undefined } };
-        },
-        .frame => blk: {
-            // TODO
-            break :blk null;
+            app.dispatch_pointer_event(.{ .leave = {} });
         },
-        .axis => |ev| blk: {
-            // std.log.info("ev={}", .{ev});
-
-            break :blk .{ .axis = .{ .value = ev.value.toInt() } };
+        .motion, .button, .axis, .frame => {
+            // Hold back until the frame callback of the surface, if one is pending
+            var can_defer = false;
+            if (app.active_surface) |active| {
+                if (app.surfaces.getPtr(active)) |surface| can_defer = !surface.frame_done;
+            }
+            if (app.pointer_frames.add(event, can_defer)) |frame| app.dispatch_pointer_frame(frame);
         },
-        else => |d| blk: {
+        else => |d| {
             _ = d;
             // std.log.info("pointer event: {}\n", .{d});
-            break :blk null;
         },
-    };
+    }
+}
+
+/// Dispatches the pointer events held back at the last `wl_pointer.frame`.
+/// Events of a group that has not seen its frame yet stay pending.
+pub fn flush_pointer_frame(app: *App) void {
+    if (app.pointer_frames.take_closed()) |frame| app.dispatch_pointer_frame(frame);
+}
+
+/// Dispatches a group of pointer events: the last position, the buttons in
+/// order and the summed vertical scroll. `Event.axis` has no direction, so
+/// horizontal scrolling is not dispatched.
+fn dispatch_pointer_frame(app: *App, frame: PointerFrames.Frame) void {
+    if (frame.position) |position| app.pointer_position = position;
+    for (frame.buttons[0..frame.button_count]) |ev| {
+        app.dispatch_pointer_event(.{ .button = .{
+            .button = @enumFromInt(ev.button),
+            .state = ev.state,
+            .pos = undefined,
+        } });
+    }
+    if (frame.vertical_scroll) |sum| {
+        const value: wlnd.Fixed = @enumFromInt(sum);
+        app.dispatch_pointer_event(.{ .axis = .{ .value = value.toInt() } });
+    }
+    // Every dispatch updates hover, so motion alone only needs one when nothing else did
+    if (frame.position != null and frame.button_count == 0 and frame.vertical_scroll == null) {
+        app.dispatch_pointer_event(null);
+    }
+}
+
+/// Updates the hover state of the widgets under the pointer and sends them `event`.
+fn dispatch_pointer_event(app: *App, event: ?Event.PointerEvent) void {
     const old_shape = app.cursor_shape;
 
-    const active_surface = app.surfaces.getPtr(app.active_surface.?) orelse return;
-    var iter = app.layout.child_iterator(active_surface.root);
-    while (iter.next()) |idx| {
+    const active_surface = app.surfaces.getPtr(app.active_surface orelse return) orelse return;
+    const client = app.client;
+    const alloc = client.allocator;
+    const hit_index = &app.hit_index;
+    hit_index.update(alloc, &app.layout, active_surface.root) catch @panic("OOM");
+    // A release has to reach pressed widgets that are no longer hovered
+    const positions = if (event != null and event.? == .button)
+        hit_index.query_all(alloc) catch @panic("OOM")
+    else
+        hit_index.query(alloc, app.pointer_position) catch @panic("OOM");
+
+    for (positions) |pos| {
+        const idx = hit_index.widgets.items[pos];
         // std.log.info("id: {}", .{idx});
-        const rect = app.layout.absolute_rect(idx);
+        const rect = hit_index.rects.items[pos];
         const was_pressed = app.layout.get(idx, .pressed);
         const was_hover = app.layout.get(idx, .hover);
         const is_hover = rect.contains_point(app.pointer_position);
@@ -240,20 +346,23 @@ fn pointer_listener(client: *wlnd.Client, _: wl.Pointer, _event: wl.Pointer.Even
             app.layout.call(idx, .handle_event, .{ev});
         }
 
-        if (event) |*ev| {
+        if (event) |ev_| {
+            var ev = ev_;
             if (is_hover or was_pressed) {
-                if (ev.* == .button) {
+                if (ev == .button) {
                     app.layout.set(idx, .pressed, ev.button.state == .pressed);
                     if (ev.button.state == .released)
                         app.layout.call(idx, .handle_event, .{Event{ .pointer = .leave }});
                 }
             }
             if (is_hover) {
-                if (ev.* == .button) ev.button.pos = widget_pos;
-                app.layout.call(idx, .handle_event, .{Event{ .pointer = ev.* }});
+                if (ev == .button) ev.button.pos = widget_pos;
+                app.layout.call(idx, .handle_event, .{Event{ .pointer = ev }});
             }
         }
     }
+    hit_index.update_hovered(alloc, &app.layout, positions) catch @panic("OOM");
+
     if (app.cursor_shape_device) |csd| {
         if (old_shape != app.cursor_shape) client.request(csd, .set_shape, .{
             .serial = app.pointer_enter_serial,
@@ -275,6 +384,71 @@ fn keyboard_listener(client: *wlnd.Client, _: wl.Keyboard, event: wl.Keyboard.Ev
     }
 }
 
+/// Pointer events for the `PointerFrames` tests
+const test_events = struct {
+    pub fn motion(x: i24, y: i24) wl.Pointer.Event {
+        return .{ .motion = .{ .time = 0, .surface_x = .fromInt(x), .surface_y = .fromInt(y) } };
+    }
+    pub fn button(code: u32) wl.Pointer.Event {
+        return .{ .button = .{ .serial = 0, .time = 0, .button = code, .state = .pressed } };
+    }
+    pub fn axis(axis_: wl.Pointer.Axis, value: f64) wl.Pointer.Event {
+        return .{ .axis = .{ .time = 0, .axis = axis_, .value = .fromDouble(value) } };
+    }
+};
+
+test "PointerFrames coalescing" {
+    const expectEqual = std.testing.expectEqual;
+    var frames = PointerFrames{};
+
+    // Events are grouped once the seat has sent a frame
+    try expectEqual(null, frames.add(.frame, false));
+
+    // Motion collapses to the last position
+    try expectEqual(null, frames.add(test_events.motion(3, 4), false));
+    try expectEqual(null, frames.add(test_events.motion(5, 6), false));
+    const moved = frames.add(.frame, false).?;
+    try expectEqual(Point{ .x = 5, .y = 6 }, moved.position.?);
+
+    // Axis values are summed per axis
+    _ = frames.add(test_events.axis(.vertical_scroll, 1.5), false);
+    _ = frames.add(test_events.axis(.horizontal_scroll, -4), false);
+    _ = frames.add(test_events.axis(.vertical_scroll, 2.25), false);
+    const scrolled = frames.add(.frame, false).?;
+    try expectEqual(wlnd.Fixed.fromDouble(3.75), @as(wlnd.Fixed, @enumFromInt(scrolled.vertical_scroll.?)));
+    try expectEqual(wlnd.Fixed.fromDouble(-4), @as(wlnd.Fixed, @enumFromInt(scrolled.horizontal_scroll.?)));
+    try expectEqual(null, scrolled.position);
+    _ = frames.add(test_events.axis(.horizontal_scroll, 1), false);
+    try expectEqual(null, frames.add(.frame, false).?.vertical_scroll);
+
+    // Buttons keep their order and flush early once 4 are pending
+    for (0..4) |i| try expectEqual(null, frames.add(test_events.button(@intCast(i)), true));
+    const full = frames.add(test_events.button(4), true).?;
+    try expectEqual(4, full.button_count);
+    for (full.buttons, 0..) |ev, i| try expectEqual(i, ev.button);
+    // Buttons are not held back for the frame callback
+    const rest = frames.add(.frame, true).?;
+    try expectEqual(1, rest.button_count);
+    try expectEqual(4, rest.buttons[0].button);
+
+    // Motion waits for the frame callback, but only once its frame arrived
+    try expectEqual(null, frames.add(test_events.motion(7, 8), true));
+    try expectEqual(null, frames.take_closed());
+    try expectEqual(null, frames.add(.frame, true));
+    try expectEqual(null, frames.add(test_events.motion(9, 10), true));
+    try expectEqual(null, frames.take_closed());
+    try expectEqual(null, frames.add(.frame, true));
+    try expectEqual(Point{ .x = 9, .y = 10 }, frames.take_closed().?.position.?);
+}
+
+test "PointerFrames without wl_pointer.frame" {
+    var frames = PointerFrames{};
+    const moved = frames.add(test_events.motion(1, 2), true).?;
+    try std.testing.expectEqual(Point{ .x = 1, .y = 2 }, moved.position.?);
+    try std.testing.expectEqual(1, frames.add(test_events.button(0x110), true).?.button_count);
+    try std.testing.expect(frames.add(test_events.axis(.vertical_scroll, 1), true).?.vertical_scroll != null);
+}
+
 const std = @import("std");
 
 const App = @This();
@@ -283,6 +457,7 @@ const Size = @import("paint/Size.zig");
 const fnt = @import("font/bdf.zig");
 const Event = @import("event.zig").Event;
 pub const Surface = @import("Surface.zig");
+const HitIndex = @import("HitIndex.zig");
 
 const w = @import("widget.zig");
 const Layout = w.Layout;
@@ -0,0 +1,268 @@
+//! Grid of absolute widget rects used to route pointer events. It is rebuilt
+//! only when the widget tree changes and patched when rects move, so an event
+//! tests the widgets overlapping the grid cell under the pointer and the ones
+//! that were hovered before, instead of walking the whole widget tree.
+
+const cell_size = 64;
+const none = std.math.maxInt(u32);
+
+root: ?WidgetIdx = null,
+generation: u32 = 0,
+
+/// Widgets reachable from `root`, in `child_iterator` order
+widgets: std.ArrayListUnmanaged(WidgetIdx) = .empty,
+/// Absolute rect of each widget in `widgets`
+rects: std.ArrayListUnmanaged(Rect) = .empty,
+/// Position of each widget in `widgets`, indexed by `WidgetIdx`
+positions: std.ArrayListUnmanaged(u32) = .empty,
+
+columns: u32 = 0,
+rows: u32 = 0,
+/// Positions of the widgets overlapping each cell, in no particular order
+cells: std.ArrayListUnmanaged(std.ArrayListUnmanaged(u32)) = .empty,
+
+hovered: std.ArrayListUnmanaged(WidgetIdx) = .empty,
+candidates: std.ArrayListUnmanaged(u32) = .empty,
+
+pub fn deinit(self: *HitIndex, alloc: std.mem.Allocator) void {
+    self.widgets.deinit(alloc);
+    self.rects.deinit(alloc);
+    self.positions.deinit(alloc);
+    for (self.cells.items) |*cell| cell.deinit(alloc);
+    self.cells.deinit(alloc);
+    self.hovered.deinit(alloc);
+    self.candidates.deinit(alloc);
+}
+
+/// Rebuilds the index if `root` or the widget tree changed since the last
+/// call, otherwise moves only the widgets in `Layout.moved`.
+pub fn update(self: *HitIndex, alloc: std.mem.Allocator, layout: *Layout, root: WidgetIdx) !void {
+    defer layout.clear_moved();
+    if (self.root == root and self.generation == layout.generation) {
+        const patched = for (layout.moved.items) |idx| {
+            if (!try self.patch(alloc, layout, idx)) break false;
+        } else true;
+        if (patched) return;
+    }
+    try self.rebuild(alloc, layout, root);
+}
+
+fn rebuild(self: *HitIndex, alloc: std.mem.Allocator, layout: *Layout, root: WidgetIdx) !void {
+    self.root = root;
+    self.generation = layout.generation;
+
+    self.widgets.clearRetainingCapacity();
+    self.rects.clearRetainingCapacity();
+    try self.positions.resize(alloc, layout.widgets.len);
+    @memset(self.positions.items, none);
+
+    var right: i32 = 0;
+    var bottom: i32 = 0;
+    var iter = layout.child_iterator(root);
+    while (iter.next()) |idx| {
+        const rect = layout.absolute_rect(idx);
+        self.positions.items[@intFromEnum(idx)] = @intCast(self.widgets.items.len);
+        try self.widgets.append(alloc, idx);
+        try self.rects.append(alloc, rect);
+        right = @max(right, rect.right());
+        bottom = @max(bottom, rect.bottom());
+    }
+
+    self.columns = std.math.divCeil(u32, @intCast(right), cell_size) catch unreachable;
+    self.rows = std.math.divCeil(u32, @intCast(bottom), cell_size) catch unreachable;
+    const cell_count = self.columns * self.rows;
+
+    if (cell_count < self.cells.items.len) {
+        for (self.cells.items[cell_count..]) |*cell| cell.deinit(alloc);
+        self.cells.shrinkRetainingCapacity(cell_count);
+    }
+    for (self.cells.items) |*cell| cell.clearRetainingCapacity();
+    try self.cells.appendNTimes(alloc, .empty, cell_count - self.cells.items.len);
+    for (self.rects.items, 0..) |rect, pos| try self.add_to_cells(alloc, rect, @intCast(pos));
+}
+
+/// Moves `moved` and its descendants to the cells of their current rects.
+/// Returns false if a rect no longer fits the grid, which needs a rebuild.
+fn patch(self: *HitIndex, alloc: std.mem.Allocator, layout: *Layout, moved: WidgetIdx) !bool {
+    if (self.position(moved) == null) return true;
+    var iter = layout.child_iterator(moved);
+    while (iter.next()) |idx| {
+        const pos = self.position(idx) orelse continue;
+        const old = self.rects.items[pos];
+        const rect = layout.absolute_rect(idx);
+        if (std.meta.eql(old, rect)) continue;
+        if (rect.right() > self.columns * cell_size or rect.bottom() > self.rows * cell_size) return false;
+        self.remove_from_cells(old, pos);
+        try self.add_to_cells(alloc, rect, pos);
+        self.rects.items[pos] = rect;
+    }
+    return true;
+}
+
+fn add_to_cells(self: *HitIndex, alloc: std.mem.Allocator, rect: Rect, pos: u32) !void {
+    var it = self.cell_iterator(rect) orelse return;
+    while (it.next()) |c| try self.cells.items[c].append(alloc, pos);
+}
+
+fn remove_from_cells(self: *HitIndex, rect: Rect, pos: u32) void {
+    var it = self.cell_iterator(rect) orelse return;
+    while (it.next()) |c| {
+        const cell = &self.cells.items[c];
+        const i = std.mem.indexOfScalar(u32, cell.items, pos).?;
+        _ = cell.swapRemove(i);
+    }
+}
+
+/// Returns the positions of the widgets that may contain `point` or that
+/// were hovered before, in `child_iterator` order.
+pub fn query(self: *HitIndex, alloc: std.mem.Allocator, point: Point) ![]const u32 {
+    self.candidates.clearRetainingCapacity();
+    if (self.cell_at(point)) |c| {
+        try self.candidates.appendSlice(alloc, self.cells.items[c].items);
+    }
+    for (self.hovered.items) |idx| {
+        const pos = self.position(idx) orelse continue;
+        if (std.mem.indexOfScalar(u32, self.candidates.items, pos) == null) {
+            try self.candidates.append(alloc, pos);
+        }
+    }
+    std.mem.sort(u32, self.candidates.items, {}, std.sort.asc(u32));
+    return self.candidates.items;
+}
+
+/// Returns the positions of all widgets, in `child_iterator` order.
+pub fn query_all(self: *HitIndex, alloc: std.mem.Allocator) ![]const u32 {
+    try self.candidates.resize(alloc, self.widgets.items.len);
+    for (self.candidates.items, 0..) |*pos, i| pos.* = @intCast(i);
+    return self.candidates.items;
+}
+
+/// Remembers which of the `candidates` are hovered, for the next `query`.
+pub fn update_hovered(self: *HitIndex, alloc: std.mem.Allocator, layout: *const Layout, candidates: []const u32) !void {
+    self.hovered.clearRetainingCapacity();
+    for (candidates) |pos| {
+        const idx = self.widgets.items[pos];
+        if (layout.get(idx, .hover)) try self.hovered.append(alloc, idx);
+    }
+}
+
+pub fn position(self: *const HitIndex, idx: WidgetIdx) ?u32 {
+    if (@intFromEnum(idx) >= self.positions.items.len) return null;
+    const pos = self.positions.items[@intFromEnum(idx)];
+    return if (pos == none) null else pos;
+}
+
+fn cell_at(self: *const HitIndex, point: Point) ?u32 {
+    if (point.x < 0 or point.y < 0) return null;
+    const column: u32 = @intCast(@divTrunc(point.x, cell_size));
+    const row: u32 = @intCast(@divTrunc(point.y, cell_size));
+    if (column >= self.columns or row >= self.rows) return null;
+    return row * self.columns + column;
+}
+
+/// Iterates over the cells overlapping `rect`, null if there are none.
+fn cell_iterator(self: *const HitIndex, rect: Rect) ?CellIterator {
+    if (rect.get_size().is_zero() or rect.right() <= 0 or rect.bottom() <= 0) return null;
+    const first_column: u32 = @intCast(@divTrunc(@max(rect.left(), 0), cell_size));
+    const first_row: u32 = @intCast(@divTrunc(@max(rect.top(), 0), cell_size));
+    return .{
+        .columns = self.columns,
+        .first_column = first_column,
+        .last_column = @intCast(@divTrunc(rect.right() - 1, cell_size)),
+        .row = first_row,
+        .last_row = @intCast(@divTrunc(rect.bottom() - 1, cell_size)),
+        .column = first_column,
+    };
+}
+
+const CellIterator = struct {
+    columns: u32,
+    first_column: u32,
+    last_column: u32,
+    row: u32,
+    last_row: u32,
+    column: u32,
+
+    pub fn next(it: *CellIterator) ?u32 {
+        if (it.column > it.last_column) {
+            it.column = it.first_column;
+            it.row += 1;
+        }
+        if (it.row > it.last_row) return null;
+        defer it.column += 1;
+        return it.row * it.columns + it.column;
+    }
+};
+
+test HitIndex {
+    const alloc = std.testing.allocator;
+    var layout = Layout{};
+    try layout.init(alloc);
+    defer layout.deinit(alloc);
+
+    const label1 = layout.add2(.label, .{});
+    const label2 = layout.add2(.label, .{});
+    const label3 = layout.add2(.label, .{});
+    const flex = layout.add3(.flex, .{}, &.{ label1, label2, label3 });
+    layout.set(label3, .flex, 1);
+    layout.set_size(flex, .tight(.{ .width = 300, .height = 100 }));
+
+    var index = HitIndex{};
+    defer index.deinit(alloc);
+    try index.update(alloc, &layout, flex);
+    try std.testing.expectEqual(5, index.columns);
+    try std.testing.expectEqual(2, index.rows);
+
+    // Cell (1, 0) overlaps label2 and label3 but not label1
+    const at_label2 = try index.query(alloc, .{ .x = 70, .y = 10 });
+    try std.testing.expectEqual(3, at_label2.len);
+    try std.testing.expectEqual(flex, index.widgets.items[at_label2[0]]);
+    try std.testing.expectEqual(label2, index.widgets.items[at_label2[1]]);
+    try std.testing.expectEqual(label3, index.widgets.items[at_label2[2]]);
+
+    layout.set(label2, .hover, true);
+    try index.update_hovered(alloc, &layout, at_label2);
+    const far = try index.query(alloc, .{ .x = 250, .y = 90 });
+    try std.testing.expectEqual(3, far.len);
+    try std.testing.expectEqual(flex, index.widgets.items[far[0]]);
+    try std.testing.expectEqual(label2, index.widgets.items[far[1]]);
+    try std.testing.expectEqual(label3, index.widgets.items[far[2]]);
+
+    const outside = try index.query(alloc, Point.INF);
+    try std.testing.expectEqual(1, outside.len);
+    try std.testing.expectEqual(label2, index.widgets.items[outside[0]]);
+    try std.testing.expectEqual(4, (try index.query_all(alloc)).len);
+
+    // Relayout with a cached size moves nothing
+    layout.set_size(flex, .tight(.{ .width = 300, .height = 100 }));
+    try std.testing.expectEqual(0, layout.moved.items.len);
+
+    // Moving a widget patches its cells without a rebuild
+    const generation = layout.generation;
+    layout.set(label1, .rect, .{ .x = 200, .y = 50, .width = 100, .height = 50 });
+    try std.testing.expectEqual(generation, layout.generation);
+    try index.update(alloc, &layout, flex);
+    try std.testing.expectEqual(0, layout.moved.items.len);
+    const moved = try index.query(alloc, .{ .x = 250, .y = 90 });
+    try std.testing.expectEqual(label1, index.widgets.items[moved[1]]);
+    for (try index.query(alloc, .{ .x = 10, .y = 10 })) |pos| {
+        try std.testing.expect(index.widgets.items[pos] != label1);
+    }
+
+    // Changing the children rebuilds it
+    layout.set(flex, .children, &.{ label1, label2 });
+    try std.testing.expect(layout.generation != generation);
+    try index.update(alloc, &layout, flex);
+    try std.testing.expectEqual(3, (try index.query_all(alloc)).len);
+    try std.testing.expectEqual(null, index.position(label3));
+}
+
+const std = @import("std");
+
+const HitIndex = @This();
+const Point = @import("paint/Point.zig");
+const Rect = @import("paint/Rect.zig");
+
+const w = @import("widget.zig");
+const Layout = w.Layout;
+const WidgetIdx = w.WidgetIdx;
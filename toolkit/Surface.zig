@@ -300,6 +300,8 @@ pub fn fractional_scale_listener(_: *wlnd.Client, _: wp.FractionalScaleV1, event
 fn frame_listener(_: *wlnd.Client, _: wl.Callback, event: wl.Callback.Event, surf: *Surface) void {
     switch (event) {
         .done => |done| {
+            // Pointer motion held back until this frame, see `App.pointer_listener`
+            surf.app.flush_pointer_frame();
             surf.draw();
             // std.log.warn("FRAME DONE!!! {s}", .{@tagName(surf.wl)});
             surf.last_frame = done.callback_data;
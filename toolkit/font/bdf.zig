@@ -298,5 +298,6 @@ test "range_index" {
     // const f = Font{};
     // try std.testing.expectEqual(1, f.range_index(500));
     try std.testing.expectEqual(0, f.range_index('a' / 256));
-    try std.testing.expectEqual(10, f.range_index('℅' / 256));
+    // Ranges 0x00-0x05, 0x0c, 0x16 and 0x1d-0x20 of cozette.bdf come before 0x21
+    try std.testing.expectEqual(12, f.range_index('℅' / 256));
 }
@@ -61,4 +61,8 @@ pub const Minmax = struct {
             .max = max,
         };
     }
+
+    pub fn is_eql(self: Minmax, other: Minmax) bool {
+        return self.min.is_eql(other.min) and self.max.is_eql(other.max);
+    }
 };
@@ -7,3 +7,11 @@ pub const widget = @import("widget.zig");
 pub const PaintCtx = @import("paint.zig").PaintCtxU32;
 pub const App = @import("App.zig");
 pub const Layout = widget.Layout;
+
+test {
+    _ = @import("widget.zig");
+    _ = @import("HitIndex.zig");
+    _ = @import("widgets/Scrollable.zig");
+    _ = @import("App.zig");
+    _ = @import("font/bdf.zig");
+}
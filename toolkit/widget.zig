@@ -9,6 +9,11 @@ const WidgetAttrs = struct {
     hover: bool = false,
     pressed: bool = false,
     dirty: bool = false,
+    /// Listed in `Layout.moved`
+    moved: bool = false,
+    layout_dirty: bool = true,
+    layout_parent: ?WidgetIdx = null,
+    layout_cache: LayoutCache = .{},
     children: []const WidgetIdx = &.{},
     parent: ?WidgetIdx = null,
     data: usize = undefined,
@@ -17,6 +22,12 @@ const WidgetAttrs = struct {
     // subsurface: ?@import("wayland").wl.Surface = null,
 };
 
+/// Result of the last `size` call of a widget and the constraints it was computed for.
+const LayoutCache = struct {
+    constraints: Size.Minmax = Size.Minmax.ZERO,
+    size: Size = Size.ZERO,
+};
+
 const root = @import("root");
 pub const root_w_types = if (@hasDecl(root, "widget_types")) root.widget_types else .{};
 const common_w_types = .{
@@ -32,6 +43,8 @@ const widget_names = std.meta.fieldNames(@TypeOf(root_w_types)) ++ std.meta.fiel
 /// pub fn handle_event(layout: *Layout, idx: WidgetIdx, event: Event) void {}
 /// pub fn size(_: *Layout, _: WidgetIdx, _: Size.Minmax) Size {}
 /// pub fn draw(layout: *Layout, idx: WidgetIdx, rect: Rect, paint_ctx: PaintCtx) bool {}
+/// and may implement `pub fn deinit(layout: *Layout, idx: WidgetIdx) void {}` to free
+/// memory allocated with `Layout.gpa`.
 const WidgetType = @Enum(u8, .exhaustive, widget_names, &std.simd.iota(u8, widget_names.len));
 
 pub fn WidgetData(comptime self: WidgetType) type {
@@ -67,15 +80,31 @@ pub const WidgetFn = enum {
 
 pub const Layout = struct {
     widgets: std.MultiArrayList(WidgetAttrs) = .{},
-    widget_alloc: std.heap.FixedBufferAllocator = undefined,
+    /// Data of widgets larger than `data`, freed all at once in `deinit`
+    widget_alloc: std.heap.ArenaAllocator = undefined,
+    /// For widgets whose storage grows, freed in their `deinit`
+    gpa: std.mem.Allocator = undefined,
+    /// Widget whose `size` is currently running, used to record `layout_parent`.
+    measuring: ?WidgetIdx = null,
+    /// Incremented whenever `set` changes a children list, so data derived
+    /// from the widget tree knows when it is stale.
+    generation: u32 = 0,
+    /// Widgets whose rect `set` changed since the last `clear_moved`
+    moved: std.ArrayListUnmanaged(WidgetIdx) = .empty,
 
     pub fn init(self: *Layout, alloc: std.mem.Allocator) !void {
         try self.widgets.ensureTotalCapacity(alloc, 100);
-        const widget_data = try alloc.alloc(u8, 5000);
-        self.widget_alloc = std.heap.FixedBufferAllocator.init(widget_data);
+        self.widget_alloc = .init(alloc);
+        self.gpa = alloc;
     }
     pub fn deinit(self: *Layout, alloc: std.mem.Allocator) void {
-        alloc.free(self.widget_alloc.buffer);
+        for (self.widgets.items(.type), 0..) |t, i| switch (t) {
+            inline else => |wt| if (@hasDecl(WidgetData(wt), "deinit")) {
+                WidgetData(wt).deinit(self, @enumFromInt(i));
+            },
+        };
+        self.widget_alloc.deinit();
+        self.moved.deinit(alloc);
         self.widgets.deinit(alloc);
     }
 
@@ -100,7 +129,7 @@ pub const Layout = struct {
         const w_data = if (@sizeOf(WidgetData(t)) <= @sizeOf(usize)) b: {
             break :b self.data(idx, WidgetData(t));
         } else b: {
-            const w_data = self.widget_alloc.allocator().create(WidgetData(t)) catch @panic("TODO");
+            const w_data = self.widget_alloc.allocator().create(WidgetData(t)) catch @panic("OOM");
             self.set(idx, .data, @intFromPtr(w_data));
             break :b w_data;
         };
@@ -108,8 +137,10 @@ pub const Layout = struct {
         return idx;
     }
 
+    /// May grow `widgets`, so pointers returned by `data` for widgets whose
+    /// data is stored inline are invalidated.
     pub fn add(self: *Layout, widget: WidgetAttrs) WidgetIdx {
-        self.widgets.appendAssumeCapacity(widget);
+        self.widgets.append(self.gpa, widget) catch @panic("OOM");
         return @enumFromInt(self.widgets.len - 1);
     }
 
@@ -121,7 +152,7 @@ pub const Layout = struct {
         }
     }
 
-    pub fn set_data(layout: *const Layout, idx: WidgetIdx, field: u8, value: *const anyopaque) void {
+    pub fn set_data(layout: *Layout, idx: WidgetIdx, field: u8, value: *const anyopaque) void {
         const t = layout.get(idx, .type);
         switch (t) {
             inline else => |wt| {
@@ -138,6 +169,7 @@ pub const Layout = struct {
                 }
             },
         }
+        layout.request_layout(idx);
         layout.request_draw(idx);
     }
 
@@ -158,12 +190,27 @@ pub const Layout = struct {
     }
 
     pub fn set(
-        self: *const Layout,
+        self: *Layout,
         idx: WidgetIdx,
         comptime item: std.meta.FieldEnum(WidgetAttrs),
         value: @FieldType(WidgetAttrs, @tagName(item)),
     ) void {
-        self.widgets.items(item)[@intFromEnum(idx)] = value;
+        const slot = &self.widgets.items(item)[@intFromEnum(idx)];
+        const changed = switch (item) {
+            .rect => !std.meta.eql(slot.*, value),
+            .children => slot.ptr != value.ptr or slot.len != value.len,
+            else => false,
+        };
+        slot.* = value;
+        if (item == .children or item == .flex) self.request_layout(idx);
+        if (changed) switch (item) {
+            .rect => if (!self.get(idx, .moved)) {
+                self.set(idx, .moved, true);
+                self.moved.append(self.gpa, idx) catch @panic("OOM");
+            },
+            .children => self.generation +%= 1,
+            else => {},
+        };
         // if (item != .rect) return;
         // if (self.get(idx, .subsurface)) |wl_surface| {
         //     const subs = self.get_app().surfaces.getPtr(wl_surface).?;
@@ -171,15 +218,56 @@ pub const Layout = struct {
         // }
     }
 
+    pub fn clear_moved(self: *Layout) void {
+        for (self.moved.items) |idx| self.set(idx, .moved, false);
+        self.moved.clearRetainingCapacity();
+    }
+
     pub fn set_size(
         self: *Layout,
         idx: WidgetIdx,
         constraints: Size.Minmax,
     ) void {
-        const size = self.call(idx, .size, .{constraints});
+        const size = self.measure(idx, constraints);
         self.set(idx, .rect, size.to_rect());
     }
 
+    /// Returns the size of `idx` for `constraints`. The previous result is
+    /// reused if the constraints are the same and nothing in the subtree
+    /// called `request_layout` since. Widgets should measure their children
+    /// through this instead of calling `size` directly.
+    pub fn measure(
+        self: *Layout,
+        idx: WidgetIdx,
+        constraints: Size.Minmax,
+    ) Size {
+        self.set(idx, .layout_parent, self.measuring);
+        const cache = self.get(idx, .layout_cache);
+        if (!self.get(idx, .layout_dirty) and cache.constraints.is_eql(constraints)) {
+            return cache.size;
+        }
+
+        const parent = self.measuring;
+        self.measuring = idx;
+        defer self.measuring = parent;
+
+        const size = self.call(idx, .size, .{constraints});
+        self.set(idx, .layout_cache, .{ .constraints = constraints, .size = size });
+        self.set(idx, .layout_dirty, false);
+        return size;
+    }
+
+    /// Invalidates the cached size of `idx` and of every widget that measured it.
+    pub fn request_layout(
+        self: *Layout,
+        idx: WidgetIdx,
+    ) void {
+        var current: ?WidgetIdx = idx;
+        while (current) |i| : (current = self.get(i, .layout_parent)) {
+            self.set(i, .layout_dirty, true);
+        }
+    }
+
     pub fn call_void(
         self: *Layout,
         idx: WidgetIdx,
@@ -238,7 +326,7 @@ pub const Layout = struct {
     }
 
     pub fn request_draw(
-        self: *const Layout,
+        self: *Layout,
         idx: WidgetIdx,
     ) void {
         self.set(idx, .dirty, true);
@@ -406,6 +494,40 @@ test ChildWidgetIterator {
     try std.testing.expectEqual(iter.next(), null);
 }
 
+test "Layout.measure" {
+    var layout = Layout{};
+    try layout.init(std.testing.allocator);
+    defer layout.deinit(std.testing.allocator);
+
+    const label1 = layout.add2(.label, .{});
+    const label2 = layout.add2(.label, .{});
+    const inner = layout.add3(.flex, .{ .orientation = .vertical }, &.{ label1, label2 });
+    const label3 = layout.add2(.label, .{});
+    const outer = layout.add2(.flex, .{});
+    layout.set(outer, .children, &.{ inner, label3 });
+
+    const constraints = Size.Minmax.tight(.{ .width = 400, .height = 300 });
+    layout.set_size(outer, constraints);
+    for ([_]WidgetIdx{ outer, inner, label1, label2, label3 }) |idx| {
+        try std.testing.expect(!layout.get(idx, .layout_dirty));
+    }
+    try std.testing.expectEqual(outer, layout.get(inner, .layout_parent));
+    try std.testing.expectEqual(inner, layout.get(label2, .layout_parent));
+    try std.testing.expectEqual(Size{ .width = 60, .height = 40 }, layout.get(inner, .rect).get_size());
+
+    layout.request_layout(label2);
+    try std.testing.expect(layout.get(label2, .layout_dirty));
+    try std.testing.expect(layout.get(inner, .layout_dirty));
+    try std.testing.expect(layout.get(outer, .layout_dirty));
+    try std.testing.expect(!layout.get(label1, .layout_dirty));
+    try std.testing.expect(!layout.get(label3, .layout_dirty));
+
+    layout.set(label3, .flex, 1);
+    layout.set_size(outer, constraints);
+    try std.testing.expect(!layout.get(outer, .layout_dirty));
+    try std.testing.expectEqual(Rect{ .x = 60, .y = 0, .width = 340, .height = 300 }, layout.get(label3, .rect));
+}
+
 const std = @import("std");
 const PaintCtx = @import("paint.zig").PaintCtxU32;
 const Rect = @import("paint/Rect.zig");
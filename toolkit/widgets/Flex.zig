@@ -89,7 +89,8 @@ pub fn size(layout: *Layout, idx: WidgetIdx, constraints: Size.Minmax) Size {
     _ = flex_rect; // autofix
     // std.log.info("constraints flex={}", .{constraints});
     const children = layout.get(idx, .children);
-    const self = layout.data(idx, Flex);
+    // Copied, measuring a child can add widgets and move the inline data
+    const self = layout.data(idx, Flex).*;
     var minor: u31 = self.orientation.minorLen(constraints.min);
 
     var non_flex_major_sum: u31 = 0;
@@ -99,7 +100,7 @@ pub fn size(layout: *Layout, idx: WidgetIdx, constraints: Size.Minmax) Size {
     for (children) |child_idx| {
         const child_flex = layout.get(child_idx, .flex);
         if (child_flex == 0) {
-            const child_size = layout.call(child_idx, .size, .{Size.Minmax.loose(constraints.max)});
+            const child_size = layout.measure(child_idx, Size.Minmax.loose(constraints.max));
             const origin = self.orientation.pack(non_flex_major_sum, 0);
             layout.set(child_idx, .rect, Rect{
                 .x = origin.x,
@@ -136,7 +137,7 @@ pub fn size(layout: *Layout, idx: WidgetIdx, constraints: Size.Minmax) Size {
                 px_per_flex * child_flex,
                 self.orientation.minorLen(constraints.min),
             );
-            const child_min = layout.call(child_idx, .size, .{Size.Minmax.loose(child_max)});
+            const child_min = layout.measure(child_idx, Size.Minmax.loose(child_max));
 
             layout.set(child_idx, .rect, .{
                 .width = @max(child_min.width, child_max.width),
@@ -7,22 +7,79 @@ const Layout = widget.Layout;
 const WidgetIdx = widget.WidgetIdx;
 
 const thumb_btn = 0;
+/// Rows materialized above and below the viewport in virtual mode
+const overscan = 2;
+const no_item = std.math.maxInt(u32);
 
 content: WidgetIdx,
 children: [1]WidgetIdx,
 offset: u31 = 0,
+source: ?DataSource = null,
+/// Widgets reused for the visible items in virtual mode; item `i` is shown by `slots[i % slot_count]`
+slots: std.ArrayListUnmanaged(WidgetIdx) = .empty,
+/// Item currently bound to each slot
+slot_items: std.ArrayListUnmanaged(u32) = .empty,
+/// Slots in use, at most the item count
+slot_count: u32 = 0,
 
+/// Provides the items of a virtual `Scrollable`. Only the items that
+/// intersect the viewport are bound to widgets, so the cost of layout and
+/// drawing does not depend on the item count.
+pub const DataSource = struct {
+    ctx: *anyopaque,
+    /// Height of every item
+    extent: u31,
+    count: *const fn (ctx: *anyopaque) u32,
+    /// Creates a widget that can show any item
+    build: *const fn (ctx: *anyopaque, layout: *Layout) WidgetIdx,
+    /// Makes the widget created by `build` show item `index`
+    bind: *const fn (ctx: *anyopaque, layout: *Layout, slot: WidgetIdx, index: u32) void,
+
+    /// `source` points to a type that implements `count`, `build` and `bind`.
+    pub fn init(source: anytype, extent: u31) DataSource {
+        const T = @typeInfo(@TypeOf(source)).pointer.child;
+        return .{
+            .ctx = @ptrCast(source),
+            .extent = extent,
+            .count = @ptrCast(&T.count),
+            .build = @ptrCast(&T.build),
+            .bind = @ptrCast(&T.bind),
+        };
+    }
+};
+
+/// Either `content` is scrolled as a whole, or the items of `source` are
+/// materialized as they come into view.
 pub const InitOpts = struct {
-    content: WidgetIdx,
+    content: ?WidgetIdx = null,
+    source: ?DataSource = null,
 };
 pub fn init(layout: *Layout, idx: WidgetIdx, opts: InitOpts) void {
+    std.debug.assert((opts.content == null) != (opts.source == null));
     const self = layout.data(idx, @This());
-    self.offset = 0;
-    self.content = opts.content;
+    self.* = .{
+        .content = opts.content orelse layout.add2(.flex, .{ .orientation = .vertical }),
+        .children = undefined,
+        .source = opts.source,
+    };
     self.children[thumb_btn] = layout.add2(.button, .{});
     layout.set(idx, .children, self.children[0..]);
 }
 
+pub fn deinit(layout: *Layout, idx: WidgetIdx) void {
+    const self = layout.data(idx, @This());
+    self.slots.deinit(layout.gpa);
+    self.slot_items.deinit(layout.gpa);
+}
+
+/// Rebinds all visible items at the next layout, for when the data behind
+/// `source` changed. The caller requests the redraw with `Layout.request_draw`.
+pub fn reload(layout: *Layout, idx: WidgetIdx) void {
+    const self = layout.data(idx, @This());
+    @memset(self.slot_items.items, no_item);
+    layout.request_layout(idx);
+}
+
 pub fn draw(layout: *Layout, idx: WidgetIdx, rect: tk.Rect, paint_ctx: PaintCtx) bool {
     const font = layout.get_app().font;
     _ = font; // autofix
@@ -89,7 +146,7 @@ pub fn thumb_rect(visible: f32, total: f32, offset: u31) tk.Rect {
     const scrubber_height: u31 = @intFromFloat(visible_fraction *
         visible);
     const scrubber_range = @as(u31, @intFromFloat(visible)) - scrubber_height;
-    const max_off: u31 = @intFromFloat(total - visible);
+    const max_off: u31 = @intFromFloat(@max(total - visible, 0));
     const scrubber_pos = if (max_off == 0) 0 else scrubber_range * offset / max_off;
 
     const r: tk.Rect = .{
@@ -119,6 +176,7 @@ pub fn handle_event(layout: *Layout, idx: WidgetIdx, event: tk.Event) void {
                     self.offset += @intCast(@abs(ev2.value));
                     self.offset = @min(self.offset, max_offset(layout, idx));
                 }
+                layout.request_layout(idx);
                 layout.get_window().re_size();
                 return;
             },
@@ -153,12 +211,19 @@ pub fn handle_event(layout: *Layout, idx: WidgetIdx, event: tk.Event) void {
 
 pub fn size(layout: *Layout, idx: WidgetIdx, minmax: tk.Size.Minmax) tk.Size {
     const self = layout.data(idx, @This());
-    self.offset = @min(self.offset, max_offset(layout, idx));
-
-    layout.set_size(self.content, minmax);
-
     const min: tk.Size = .{ .width = 60, .height = 20 };
     const rsize = min.unite(minmax.max);
+
+    if (self.source) |source| {
+        const count = source.count(source.ctx);
+        layout.set(self.content, .rect, .{ .width = rsize.width, .height = @intCast(count * source.extent) });
+        self.offset = @min(self.offset, max_offset(layout, idx));
+        layout_items(layout, self, source, count, rsize);
+    } else {
+        self.offset = @min(self.offset, max_offset(layout, idx));
+        layout.set_size(self.content, minmax);
+    }
+
     // std.log.info("minmax={}", .{minmax});
     {
         const content_rect = layout.get(self.content, .rect);
@@ -169,3 +234,109 @@ pub fn size(layout: *Layout, idx: WidgetIdx, minmax: tk.Size.Minmax) tk.Size {
     }
     return rsize;
 }
+
+/// Binds the items that intersect the viewport, plus `overscan` rows on each
+/// side, to slots and positions them in content coordinates.
+fn layout_items(layout: *Layout, self: *@This(), source: DataSource, count: u32, viewport: tk.Size) void {
+    const extent = source.extent;
+
+    const visible = std.math.divCeil(u32, viewport.height, extent) catch unreachable;
+    const needed = @min(visible + 1 + 2 * overscan, count);
+    if (needed != self.slot_count) {
+        // Slots past `needed` are kept around for when the viewport or the count grows again
+        while (self.slots.items.len < needed) {
+            self.slots.append(layout.gpa, source.build(source.ctx, layout)) catch @panic("OOM");
+            self.slot_items.append(layout.gpa, no_item) catch @panic("OOM");
+        }
+        self.slot_count = needed;
+        // Changing the slot count changes which slot shows which item
+        @memset(self.slot_items.items, no_item);
+        layout.set(self.content, .children, self.slots.items[0..self.slot_count]);
+    }
+    if (self.slot_count == 0) return;
+
+    const first = @min((self.offset / extent) -| overscan, count - self.slot_count);
+    for (first..first + self.slot_count) |i| {
+        const item: u32 = @intCast(i);
+        const s = item % self.slot_count;
+        const slot = self.slots.items[s];
+        if (self.slot_items.items[s] != item) {
+            source.bind(source.ctx, layout, slot, item);
+            layout.set(slot, .layout_dirty, true);
+            self.slot_items.items[s] = item;
+        }
+        const slot_size = layout.measure(slot, .tight(.{ .width = viewport.width, .height = extent }));
+        layout.set(slot, .rect, .{
+            .y = @intCast(item * extent),
+            .width = slot_size.width,
+            .height = extent,
+        });
+    }
+}
+
+test "virtual Scrollable" {
+    const Items = struct {
+        binds: u32 = 0,
+        len: u32 = 1000,
+
+        pub fn count(items: *@This()) u32 {
+            return items.len;
+        }
+        pub fn build(_: *@This(), layout: *Layout) WidgetIdx {
+            return layout.add2(.label, .{});
+        }
+        pub fn bind(items: *@This(), _: *Layout, _: WidgetIdx, _: u32) void {
+            items.binds += 1;
+        }
+    };
+    var layout = Layout{};
+    try layout.init(std.testing.allocator);
+    defer layout.deinit(std.testing.allocator);
+
+    var items = Items{};
+    const idx = layout.add4(.scrollable, .{ .source = .init(&items, 20) });
+    const self = layout.data(idx, @This());
+    const viewport: tk.Size.Minmax = .tight(.{ .width = 100, .height = 100 });
+
+    layout.set_size(idx, viewport);
+    try std.testing.expectEqual(10, self.slot_count);
+    try std.testing.expectEqual(10, items.binds);
+    try std.testing.expectEqual(20000, layout.get(self.content, .rect).height);
+
+    // Scrolling by 5 rows rebinds only the slots of the 5 new items
+    self.offset = 7 * 20;
+    layout.request_layout(idx);
+    layout.set_size(idx, viewport);
+    try std.testing.expectEqual(15, items.binds);
+    const slot = self.slots.items[12 % self.slot_count];
+    try std.testing.expectEqual(12, self.slot_items.items[12 % self.slot_count]);
+    try std.testing.expectEqual(12 * 20, layout.get(slot, .rect).y);
+
+    self.offset = std.math.maxInt(u31);
+    layout.request_layout(idx);
+    layout.set_size(idx, viewport);
+    try std.testing.expectEqual(20000 - 100, self.offset);
+    try std.testing.expectEqual(999, self.slot_items.items[999 % self.slot_count]);
+
+    // The data shrinks below the number of slots
+    items.len = 3;
+    reload(&layout, idx);
+    layout.set_size(idx, viewport);
+    try std.testing.expectEqual(3, self.slot_count);
+    try std.testing.expectEqual(0, self.offset);
+    try std.testing.expectEqual(3, layout.get(self.content, .children).len);
+    for (self.slot_items.items[0..3], 0..) |item, s| try std.testing.expectEqual(s, item);
+
+    // More rows than a fixed slot array would hold
+    items.len = 1000;
+    reload(&layout, idx);
+    layout.set_size(idx, .tight(.{ .width = 100, .height = 1440 }));
+    try std.testing.expectEqual(1440 / 20 + 1 + 2 * overscan, self.slot_count);
+    try std.testing.expectEqual(self.slot_count, layout.get(self.content, .children).len);
+
+    // More widgets than `Layout.init` reserves room for
+    layout.set_size(idx, .tight(.{ .width = 100, .height = 4000 }));
+    try std.testing.expectEqual(4000 / 20 + 1 + 2 * overscan, self.slot_count);
+    try std.testing.expect(layout.widgets.len > 200);
+    try std.testing.expectEqual(204, self.slot_items.items[204]);
+}
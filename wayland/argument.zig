@@ -52,7 +52,7 @@ pub const Argument = union(enum) {
         const l = switch (self) {
             .string => |str| (std.math.divCeil(usize, 4 + str.len + 1, 4) catch unreachable) * 4,
             .fd => 0,
-            .array => |a| 4 + a.alloc,
+            .array => |a| 4 + std.mem.alignForward(usize, a.size, 4),
             inline else => |n| @sizeOf(@TypeOf(n)),
             // else => unreachable,
         };
@@ -76,14 +76,17 @@ pub const Argument = union(enum) {
             .string => |inner| {
                 try writer.writeInt(u32, @intCast(inner.len + 1), .little);
                 try writer.writeAll(inner);
-                std.debug.print("self.le {} {}\n", .{ self.len(), inner.len });
                 try writer.splatByteAll(0, self.len() - (4 + inner.len));
             },
-            .fd => {},
-            else => {
-                std.debug.print("arg {}", .{self});
-                unreachable;
+            .fixed => |inner| {
+                try writer.writeInt(i32, @intFromEnum(inner), .little);
+            },
+            .array => |inner| {
+                try writer.writeInt(u32, @intCast(inner.size), .little);
+                try writer.writeAll(inner.slice(u8));
+                try writer.splatByteAll(0, self.len() - (4 + inner.size));
             },
+            .fd => {},
         }
     }
     pub fn unmarshal(typ: ArgumentType, allocator: std.mem.Allocator, data: []const u8) Argument {
@@ -135,11 +138,41 @@ pub const Argument = union(enum) {
 
 test "marshaling" {
     var buf1: [255]u8 = undefined;
-    var fbs1 = std.io.fixedBufferStream(&buf1);
+    var writer = std.Io.Writer.fixed(&buf1);
     const arg = Argument{ .string = "frappo" };
-    try arg.marshal(fbs1.writer());
-    const written = fbs1.getWritten();
+    try arg.marshal(&writer);
+    const written = writer.buffered();
     try std.testing.expect(@as(u32, @bitCast(written[0..4].*)) == 7);
     try std.testing.expectEqualSlices(u8, "frappo", written[4..][0..6]);
     try std.testing.expect(written.len % 4 == 0);
 }
+
+test "marshal, unmarshal" {
+    var keys = [_]u8{ 1, 2, 3, 4, 5 };
+    const args = [_]Argument{
+        .{ .uint = 7 },
+        .{ .int = -3 },
+        .{ .fixed = .fromDouble(1.5) },
+        .{ .string = "seat0" },
+        .{ .array = .{ .size = keys.len, .alloc = 8, .data = &keys } },
+        // `alloc` is the capacity of the source list, only `size` goes on the wire
+        .{ .array = .{ .size = 3, .alloc = 16, .data = &keys } },
+    };
+    var buf: [64]u8 align(4) = undefined;
+    var writer = std.Io.Writer.fixed(&buf);
+    for (&args) |*arg| try arg.marshal(&writer);
+    try std.testing.expectEqual(4 + 4 + 4 + 12 + 12 + 8, writer.buffered().len);
+
+    var data: []const u8 = writer.buffered();
+    for (args) |arg| {
+        const got = Argument.unmarshal(arg, std.testing.allocator, data);
+        try std.testing.expectEqual(arg.len(), got.len());
+        switch (arg) {
+            .string => |s| try std.testing.expectEqualStrings(s, got.string),
+            .array => |a| try std.testing.expectEqualSlices(u8, a.slice(u8), got.array.slice(u8)),
+            else => try std.testing.expectEqual(arg, got),
+        }
+        data = data[got.len()..];
+    }
+    try std.testing.expectEqual(0, data.len);
+}
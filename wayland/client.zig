@@ -2,6 +2,8 @@ const std = @import("std");
 const linux = std.os.linux;
 const Proxy = @import("proxy.zig").Proxy;
 const ObjectAttrs = @import("proxy.zig").ObjectAttrs;
+const Listener = @import("proxy.zig").Listener;
+const ListenerId = @import("proxy.zig").ListenerId;
 const Argument = @import("argument.zig").Argument;
 const RingBuffer = @import("ring_buffer.zig").RingBuffer;
 const wl = @import("generated/wl.zig");
@@ -77,6 +79,8 @@ pub const Client = struct {
     // objects: std.ArrayListUnmanaged(?Proxy) = .{},
     objects: std.MultiArrayList(ObjectAttrs) = .{},
     unused_oids: std.ArrayListUnmanaged(u32) = .{},
+    /// Distinct listener functions passed to `set_listener`, objects refer to them by `ListenerId`
+    listeners: std.ArrayListUnmanaged(Listener) = .{},
     connection: *Connection,
     allocator: std.mem.Allocator,
 
@@ -112,7 +116,7 @@ pub const Client = struct {
 
         const idx = self.next_id();
 
-        self.objects.set(idx, .{ .interface = &wl.Display.interface });
+        self.objects.set(idx, .{ .interface = wl.Display.id });
 
         self.wl_display = @enumFromInt(idx);
 
@@ -204,6 +208,7 @@ pub const Client = struct {
         _ = linux.close(self.connection.socket_fd);
         self.objects.deinit(self.allocator);
         self.unused_oids.deinit(self.allocator);
+        self.listeners.deinit(self.allocator);
         self.allocator.destroy(self.connection);
         self.allocator.destroy(self);
     }
@@ -249,15 +254,25 @@ pub const Client = struct {
             }
         };
 
-        self.set(object, .listener, w.inner);
+        self.set(object, .listener, self.listener_id(w.inner));
         self.set(object, .listener_data, _data);
     }
 
+    fn listener_id(self: *Client, listener: Listener) ListenerId {
+        for (self.listeners.items, 0..) |l, i| {
+            if (l == listener) return @enumFromInt(i);
+        }
+        // The last id is `ListenerId.none`
+        if (self.listeners.items.len == std.math.maxInt(u16)) @panic("too many listeners");
+        self.listeners.append(self.allocator, listener) catch @panic("OOM");
+        return @enumFromInt(self.listeners.items.len - 1);
+    }
+
     pub fn get(
         self: *Client,
         idx: anytype,
         comptime item: std.meta.FieldEnum(ObjectAttrs),
-    ) std.meta.FieldType(ObjectAttrs, item) {
+    ) @FieldType(ObjectAttrs, @tagName(item)) {
         return self.objects.items(item)[@intFromEnum(idx)];
     }
 
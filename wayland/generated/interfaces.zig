@@ -0,0 +1,108 @@
+pub const InterfaceId = enum(u16) {
+    wl_display,
+    wl_registry,
+    wl_callback,
+    wl_compositor,
+    wl_shm_pool,
+    wl_shm,
+    wl_buffer,
+    wl_data_offer,
+    wl_data_source,
+    wl_data_device,
+    wl_data_device_manager,
+    wl_shell,
+    wl_shell_surface,
+    wl_surface,
+    wl_seat,
+    wl_pointer,
+    wl_keyboard,
+    wl_touch,
+    wl_output,
+    wl_region,
+    wl_subcompositor,
+    wl_subsurface,
+    wl_fixes,
+    xdg_wm_base,
+    xdg_positioner,
+    xdg_surface,
+    xdg_toplevel,
+    xdg_popup,
+    zwlr_layer_shell_v1,
+    zwlr_layer_surface_v1,
+    zwp_tablet_manager_v2,
+    zwp_tablet_seat_v2,
+    zwp_tablet_tool_v2,
+    zwp_tablet_v2,
+    zwp_tablet_pad_ring_v2,
+    zwp_tablet_pad_strip_v2,
+    zwp_tablet_pad_group_v2,
+    zwp_tablet_pad_v2,
+    zwp_keyboard_shortcuts_inhibit_manager_v1,
+    zwp_keyboard_shortcuts_inhibitor_v1,
+    wp_cursor_shape_manager_v1,
+    wp_cursor_shape_device_v1,
+    wp_viewporter,
+    wp_viewport,
+    wp_fractional_scale_manager_v1,
+    wp_fractional_scale_v1,
+    zxdg_decoration_manager_v1,
+    zxdg_toplevel_decoration_v1,
+};
+/// Indexed by `InterfaceId`
+pub const interfaces = [_]Interface{
+    wl.Display.interface,
+    wl.Registry.interface,
+    wl.Callback.interface,
+    wl.Compositor.interface,
+    wl.ShmPool.interface,
+    wl.Shm.interface,
+    wl.Buffer.interface,
+    wl.DataOffer.interface,
+    wl.DataSource.interface,
+    wl.DataDevice.interface,
+    wl.DataDeviceManager.interface,
+    wl.Shell.interface,
+    wl.ShellSurface.interface,
+    wl.Surface.interface,
+    wl.Seat.interface,
+    wl.Pointer.interface,
+    wl.Keyboard.interface,
+    wl.Touch.interface,
+    wl.Output.interface,
+    wl.Region.interface,
+    wl.Subcompositor.interface,
+    wl.Subsurface.interface,
+    wl.Fixes.interface,
+    xdg.WmBase.interface,
+    xdg.Positioner.interface,
+    xdg.Surface.interface,
+    xdg.Toplevel.interface,
+    xdg.Popup.interface,
+    zwlr.LayerShellV1.interface,
+    zwlr.LayerSurfaceV1.interface,
+    zwp.TabletManagerV2.interface,
+    zwp.TabletSeatV2.interface,
+    zwp.TabletToolV2.interface,
+    zwp.TabletV2.interface,
+    zwp.TabletPadRingV2.interface,
+    zwp.TabletPadStripV2.interface,
+    zwp.TabletPadGroupV2.interface,
+    zwp.TabletPadV2.interface,
+    zwp.KeyboardShortcutsInhibitManagerV1.interface,
+    zwp.KeyboardShortcutsInhibitorV1.interface,
+    wp.CursorShapeManagerV1.interface,
+    wp.CursorShapeDeviceV1.interface,
+    wp.Viewporter.interface,
+    wp.Viewport.interface,
+    wp.FractionalScaleManagerV1.interface,
+    wp.FractionalScaleV1.interface,
+    zxdg.DecorationManagerV1.interface,
+    zxdg.ToplevelDecorationV1.interface,
+};
+const Interface = @import("../proxy.zig").Interface;
+const wl = @import("wl.zig");
+const xdg = @import("xdg.zig");
+const zwlr = @import("zwlr.zig");
+const zwp = @import("zwp.zig");
+const wp = @import("wp.zig");
+const zxdg = @import("zxdg.zig");
@@ -43,6 +43,7 @@ pub const Display = enum(u32) {
             "get_registry",
         },
     };
+    pub const id = InterfaceId.wl_display;
     pub const Error = enum(c_int) {
         invalid_object = 0,
         invalid_method = 1,
@@ -168,6 +169,7 @@ pub const Registry = enum(u32) {
             "bind",
         },
     };
+    pub const id = InterfaceId.wl_registry;
     pub const Event = union(enum) {
         /// Notify the client of global objects.
         ///
@@ -249,6 +251,7 @@ pub const Callback = enum(u32) {
             "done",
         },
     };
+    pub const id = InterfaceId.wl_callback;
     pub const Event = union(enum) {
         /// Notify the client when the related request is done.
         done: struct {
@@ -291,6 +294,7 @@ pub const Compositor = enum(u32) {
             "create_region",
         },
     };
+    pub const id = InterfaceId.wl_compositor;
     pub const Request = union(enum) {
         /// Ask the compositor to create a new surface.
         create_surface: struct {
@@ -330,6 +334,7 @@ pub const ShmPool = enum(u32) {
             "resize",
         },
     };
+    pub const id = InterfaceId.wl_shm_pool;
     pub const Request = union(enum) {
         /// Create a wl_buffer object from the pool.
         ///
@@ -407,6 +412,7 @@ pub const Shm = enum(u32) {
             "release",
         },
     };
+    pub const id = InterfaceId.wl_shm;
     pub const Error = enum(c_int) {
         invalid_format = 0,
         invalid_stride = 1,
@@ -617,6 +623,7 @@ pub const Buffer = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.wl_buffer;
     pub const Event = union(enum) {
         /// Sent when this wl_buffer is no longer used by the compositor.
         ///
@@ -690,6 +697,7 @@ pub const DataOffer = enum(u32) {
             "set_actions",
         },
     };
+    pub const id = InterfaceId.wl_data_offer;
     pub const Error = enum(c_int) {
         invalid_finish = 0,
         invalid_action_mask = 1,
@@ -908,6 +916,7 @@ pub const DataSource = enum(u32) {
             "set_actions",
         },
     };
+    pub const id = InterfaceId.wl_data_source;
     pub const Error = enum(c_int) {
         invalid_action_mask = 0,
         invalid_source = 1,
@@ -1092,6 +1101,7 @@ pub const DataDevice = enum(u32) {
             "release",
         },
     };
+    pub const id = InterfaceId.wl_data_device;
     pub const Error = enum(c_int) {
         role = 0,
         used_source = 1,
@@ -1279,6 +1289,7 @@ pub const DataDeviceManager = enum(u32) {
             "get_data_device",
         },
     };
+    pub const id = InterfaceId.wl_data_device_manager;
     pub const DndAction = packed struct(u32) {
         copy: bool = false,
         move: bool = false,
@@ -1325,6 +1336,7 @@ pub const Shell = enum(u32) {
             "get_shell_surface",
         },
     };
+    pub const id = InterfaceId.wl_shell;
     pub const Error = enum(c_int) {
         role = 0,
     };
@@ -1388,6 +1400,7 @@ pub const ShellSurface = enum(u32) {
             "set_class",
         },
     };
+    pub const id = InterfaceId.wl_shell_surface;
     pub const Resize = packed struct(u32) {
         top: bool = false,
         bottom: bool = false,
@@ -1700,6 +1713,7 @@ pub const Surface = enum(u32) {
             "offset",
         },
     };
+    pub const id = InterfaceId.wl_surface;
     pub const Error = enum(c_int) {
         invalid_scale = 0,
         invalid_transform = 1,
@@ -2154,6 +2168,7 @@ pub const Seat = enum(u32) {
             "release",
         },
     };
+    pub const id = InterfaceId.wl_seat;
     pub const Capability = packed struct(u32) {
         pointer: bool = false,
         keyboard: bool = false,
@@ -2326,6 +2341,7 @@ pub const Pointer = enum(u32) {
             "release",
         },
     };
+    pub const id = InterfaceId.wl_pointer;
     pub const Error = enum(c_int) {
         role = 0,
     };
@@ -2768,6 +2784,7 @@ pub const Keyboard = enum(u32) {
             "release",
         },
     };
+    pub const id = InterfaceId.wl_keyboard;
     pub const KeymapFormat = enum(c_int) {
         no_keymap = 0,
         xkb_v1 = 1,
@@ -2987,6 +3004,7 @@ pub const Touch = enum(u32) {
             "release",
         },
     };
+    pub const id = InterfaceId.wl_touch;
     pub const Event = union(enum) {
         /// A new touch point has appeared on the surface. This touch point is
         /// assigned a unique ID. Future events from this touch point reference
@@ -3184,6 +3202,7 @@ pub const Output = enum(u32) {
             "release",
         },
     };
+    pub const id = InterfaceId.wl_output;
     pub const Subpixel = enum(c_int) {
         unknown = 0,
         none = 1,
@@ -3428,6 +3447,7 @@ pub const Region = enum(u32) {
             "subtract",
         },
     };
+    pub const id = InterfaceId.wl_region;
     pub const Request = union(enum) {
         /// Destroy the region.  This will invalidate the object ID.
         destroy: void,
@@ -3487,6 +3507,7 @@ pub const Subcompositor = enum(u32) {
             "get_subsurface",
         },
     };
+    pub const id = InterfaceId.wl_subcompositor;
     pub const Error = enum(c_int) {
         bad_surface = 0,
         bad_parent = 1,
@@ -3598,6 +3619,7 @@ pub const Subsurface = enum(u32) {
             "set_desync",
         },
     };
+    pub const id = InterfaceId.wl_subsurface;
     pub const Error = enum(c_int) {
         bad_surface = 0,
     };
@@ -3708,6 +3730,7 @@ pub const Fixes = enum(u32) {
             "destroy_registry",
         },
     };
+    pub const id = InterfaceId.wl_fixes;
     pub const Request = union(enum) {
         destroy: void,
         /// This request destroys a wl_registry object.
@@ -3740,3 +3763,4 @@ const Interface = @import("../proxy.zig").Interface;
 const Argument = @import("../argument.zig").Argument;
 const Fixed = @import("../argument.zig").Fixed;
 const Client = @import("../client.zig").Client;
+const InterfaceId = @import("interfaces.zig").InterfaceId;
@@ -37,6 +37,7 @@ pub const CursorShapeManagerV1 = enum(u32) {
             "get_tablet_tool_v2",
         },
     };
+    pub const id = InterfaceId.wp_cursor_shape_manager_v1;
     pub const Request = union(enum) {
         /// Destroy the cursor shape manager.
         destroy: void,
@@ -80,6 +81,7 @@ pub const CursorShapeDeviceV1 = enum(u32) {
             "set_shape",
         },
     };
+    pub const id = InterfaceId.wp_cursor_shape_device_v1;
     pub const Shape = enum(c_int) {
         default = 1,
         context_menu = 2,
@@ -197,6 +199,7 @@ pub const Viewporter = enum(u32) {
             "get_viewport",
         },
     };
+    pub const id = InterfaceId.wp_viewporter;
     pub const Error = enum(c_int) {
         viewport_exists = 0,
     };
@@ -290,6 +293,7 @@ pub const Viewport = enum(u32) {
             "set_destination",
         },
     };
+    pub const id = InterfaceId.wp_viewport;
     pub const Error = enum(c_int) {
         bad_value = 0,
         bad_size = 1,
@@ -375,6 +379,7 @@ pub const FractionalScaleManagerV1 = enum(u32) {
             "get_fractional_scale",
         },
     };
+    pub const id = InterfaceId.wp_fractional_scale_manager_v1;
     pub const Error = enum(c_int) {
         fractional_scale_exists = 0,
     };
@@ -420,6 +425,7 @@ pub const FractionalScaleV1 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.wp_fractional_scale_v1;
     pub const Event = union(enum) {
         /// Notification of a new preferred scale for this surface that the
         /// compositor suggests that the client should use.
@@ -464,6 +470,7 @@ const Interface = @import("../proxy.zig").Interface;
 const Argument = @import("../argument.zig").Argument;
 const Fixed = @import("../argument.zig").Fixed;
 const Client = @import("../client.zig").Client;
+const InterfaceId = @import("interfaces.zig").InterfaceId;
 
 const zwp = @import("zwp.zig");
 const wl = @import("wl.zig");
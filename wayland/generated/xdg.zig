@@ -47,6 +47,7 @@ pub const WmBase = enum(u32) {
             "pong",
         },
     };
+    pub const id = InterfaceId.xdg_wm_base;
     pub const Error = enum(c_int) {
         role = 0,
         defunct_surfaces = 1,
@@ -175,6 +176,7 @@ pub const Positioner = enum(u32) {
             "set_parent_configure",
         },
     };
+    pub const id = InterfaceId.xdg_positioner;
     pub const Error = enum(c_int) {
         invalid_input = 0,
     };
@@ -399,6 +401,7 @@ pub const Surface = enum(u32) {
             "ack_configure",
         },
     };
+    pub const id = InterfaceId.xdg_surface;
     pub const Error = enum(c_int) {
         not_constructed = 1,
         already_constructed = 2,
@@ -619,6 +622,7 @@ pub const Toplevel = enum(u32) {
             "set_minimized",
         },
     };
+    pub const id = InterfaceId.xdg_toplevel;
     pub const Error = enum(c_int) {
         invalid_resize_edge = 0,
         invalid_parent = 1,
@@ -1136,6 +1140,7 @@ pub const Popup = enum(u32) {
             "reposition",
         },
     };
+    pub const id = InterfaceId.xdg_popup;
     pub const Error = enum(c_int) {
         invalid_grab = 0,
     };
@@ -1298,5 +1303,6 @@ const Interface = @import("../proxy.zig").Interface;
 const Argument = @import("../argument.zig").Argument;
 const Fixed = @import("../argument.zig").Fixed;
 const Client = @import("../client.zig").Client;
+const InterfaceId = @import("interfaces.zig").InterfaceId;
 
 const wl = @import("wl.zig");
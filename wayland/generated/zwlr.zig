@@ -38,6 +38,7 @@ pub const LayerShellV1 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwlr_layer_shell_v1;
     pub const Error = enum(c_int) {
         role = 0,
         invalid_layer = 1,
@@ -134,6 +135,7 @@ pub const LayerSurfaceV1 = enum(u32) {
             "set_layer",
         },
     };
+    pub const id = InterfaceId.zwlr_layer_surface_v1;
     pub const KeyboardInteractivity = enum(c_int) {
         none = 0,
         exclusive = 1,
@@ -351,6 +353,7 @@ const Interface = @import("../proxy.zig").Interface;
 const Argument = @import("../argument.zig").Argument;
 const Fixed = @import("../argument.zig").Fixed;
 const Client = @import("../client.zig").Client;
+const InterfaceId = @import("interfaces.zig").InterfaceId;
 
 const wl = @import("wl.zig");
 const xdg = @import("xdg.zig");
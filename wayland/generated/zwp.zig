@@ -35,6 +35,7 @@ pub const TabletManagerV2 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_tablet_manager_v2;
     pub const Request = union(enum) {
         /// Get the wp_tablet_seat object for the given seat. This object
         /// provides access to all graphics tablets in this seat.
@@ -79,6 +80,7 @@ pub const TabletSeatV2 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_tablet_seat_v2;
     pub const Event = union(enum) {
         /// This event is sent whenever a new tablet becomes available on this
         /// seat. This event only provides the object id of the tablet, any
@@ -213,6 +215,7 @@ pub const TabletToolV2 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_tablet_tool_v2;
     pub const Type = enum(c_int) {
         pen = 320,
         eraser = 321,
@@ -625,6 +628,7 @@ pub const TabletV2 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_tablet_v2;
     pub const Event = union(enum) {
         /// A descriptive name for the tablet device.
         ///
@@ -743,6 +747,7 @@ pub const TabletPadRingV2 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_tablet_pad_ring_v2;
     pub const Source = enum(c_int) {
         finger = 1,
     };
@@ -887,6 +892,7 @@ pub const TabletPadStripV2 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_tablet_pad_strip_v2;
     pub const Source = enum(c_int) {
         finger = 1,
     };
@@ -1052,6 +1058,7 @@ pub const TabletPadGroupV2 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_tablet_pad_group_v2;
     pub const Event = union(enum) {
         /// Sent on wp_tablet_pad_group initialization to announce the available
         /// buttons in the group. Button indices start at 0, a button may only be
@@ -1237,6 +1244,7 @@ pub const TabletPadV2 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_tablet_pad_v2;
     pub const ButtonState = enum(c_int) {
         released = 0,
         pressed = 1,
@@ -1423,6 +1431,7 @@ pub const KeyboardShortcutsInhibitManagerV1 = enum(u32) {
             "inhibit_shortcuts",
         },
     };
+    pub const id = InterfaceId.zwp_keyboard_shortcuts_inhibit_manager_v1;
     pub const Error = enum(c_int) {
         already_inhibited = 0,
     };
@@ -1501,6 +1510,7 @@ pub const KeyboardShortcutsInhibitorV1 = enum(u32) {
             "destroy",
         },
     };
+    pub const id = InterfaceId.zwp_keyboard_shortcuts_inhibitor_v1;
     pub const Event = union(enum) {
         /// This event indicates that the shortcut inhibitor is active.
         ///
@@ -1549,5 +1559,6 @@ const Interface = @import("../proxy.zig").Interface;
 const Argument = @import("../argument.zig").Argument;
 const Fixed = @import("../argument.zig").Fixed;
 const Client = @import("../client.zig").Client;
+const InterfaceId = @import("interfaces.zig").InterfaceId;
 
 const wl = @import("wl.zig");
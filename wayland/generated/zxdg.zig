@@ -51,6 +51,7 @@ pub const DecorationManagerV1 = enum(u32) {
             "get_toplevel_decoration",
         },
     };
+    pub const id = InterfaceId.zxdg_decoration_manager_v1;
     pub const Request = union(enum) {
         /// Destroy the decoration manager. This doesn't destroy objects created
         /// with the manager.
@@ -101,6 +102,7 @@ pub const ToplevelDecorationV1 = enum(u32) {
             "unset_mode",
         },
     };
+    pub const id = InterfaceId.zxdg_toplevel_decoration_v1;
     pub const Error = enum(c_int) {
         unconfigured_buffer = 0,
         already_constructed = 1,
@@ -189,5 +191,6 @@ const Interface = @import("../proxy.zig").Interface;
 const Argument = @import("../argument.zig").Argument;
 const Fixed = @import("../argument.zig").Fixed;
 const Client = @import("../client.zig").Client;
+const InterfaceId = @import("interfaces.zig").InterfaceId;
 
 const xdg = @import("xdg.zig");
@@ -1,6 +1,9 @@
 pub const Client = @import("client.zig").Client;
+pub const Connection = @import("client.zig").Connection;
 pub const Argument = @import("argument.zig").Argument;
+pub const Fixed = @import("argument.zig").Fixed;
 pub const Proxy = @import("proxy.zig").Proxy;
+pub const RingBuffer = @import("ring_buffer.zig").RingBuffer;
 pub const shm = @import("shm.zig");
 
 pub const wl = @import("generated/wl.zig");
@@ -11,5 +14,7 @@ pub const zwp = @import("generated/zwp.zig");
 pub const zxdg = @import("generated/zxdg.zig");
 
 test {
+    _ = @import("argument.zig");
+    _ = @import("proxy.zig");
     _ = @import("shm.zig");
 }
@@ -2,6 +2,8 @@ const std = @import("std");
 const argm = @import("argument.zig");
 const Argument = argm.Argument;
 const Client = @import("client.zig").Client;
+const InterfaceId = @import("generated/interfaces.zig").InterfaceId;
+const interfaces = @import("generated/interfaces.zig").interfaces;
 const log = std.log.scoped(.wl);
 
 pub const Interface = struct {
@@ -12,9 +14,17 @@ pub const Interface = struct {
     request_names: []const []const u8 = &.{},
 };
 
+pub const Listener = *const fn (*Client, u32, u16, []Argument, data: ?*anyopaque) void;
+
+/// Index into `Client.listeners`
+pub const ListenerId = enum(u16) {
+    none = std.math.maxInt(u16),
+    _,
+};
+
 pub const ObjectAttrs = struct {
-    interface: *const Interface,
-    listener: ?*const fn (*Client, u32, u16, []Argument, data: ?*anyopaque) void = null,
+    interface: InterfaceId,
+    listener: ListenerId = .none,
     listener_data: ?*anyopaque = undefined,
     is_free: bool = false,
 };
@@ -52,7 +62,7 @@ pub const Proxy = struct {
     pub fn unmarshal_event(self: Proxy, data: []const u8, opcode: u16) void {
         // std.log.info("unmarshal {any}", .{self.id});
 
-        const interface = self.get(.interface);
+        const interface = &interfaces[@intFromEnum(self.get(.interface))];
         const listener = self.get(.listener);
         const listener_data = self.get(.listener_data);
         log.debug("<- {s}@{}.{s}", .{ interface.name, self.id, interface.event_names[opcode] });
@@ -64,8 +74,9 @@ pub const Proxy = struct {
             args[i] = Argument.unmarshal(arg_type, self.client.allocator, argdata);
             argdata = argdata[args[i].len()..];
         }
-        if (listener) |l| {
+        if (listener != .none) {
             // std.debug.print("listener {s}\n", .{interface.name});
+            const l = self.client.listeners.items[@intFromEnum(listener)];
             l(self.client, self.id, opcode, args[0..signature.len], listener_data);
         }
     }
@@ -74,7 +85,7 @@ pub const Proxy = struct {
         const next_proxy = self.client.next_object();
         // std.log.info("next id {}", .{next_proxy.id});
         self.client.objects.set(next_proxy.id, .{
-            .interface = &T.interface,
+            .interface = T.id,
         });
 
         for (args) |*arg| {
@@ -174,3 +185,70 @@ pub fn request_to_args(
     // std.log.warn("Z: {any}", .{args});
     return args;
 }
+
+test "unmarshal_event" {
+    const gpa = std.testing.allocator;
+    const wl = @import("generated/wl.zig");
+    var client: Client = .{
+        .wl_display = @enumFromInt(1),
+        .connection = undefined,
+        .allocator = gpa,
+    };
+    defer client.objects.deinit(gpa);
+    defer client.listeners.deinit(gpa);
+
+    const seat0: wl.Seat = @enumFromInt(2);
+    const seat1: wl.Seat = @enumFromInt(3);
+    const output: wl.Output = @enumFromInt(4);
+    try client.objects.append(gpa, .{ .interface = wl.Display.id, .is_free = true });
+    try client.objects.append(gpa, .{ .interface = wl.Display.id });
+    try client.objects.append(gpa, .{ .interface = wl.Seat.id });
+    try client.objects.append(gpa, .{ .interface = wl.Seat.id });
+    try client.objects.append(gpa, .{ .interface = wl.Output.id });
+
+    const Seen = struct {
+        seat: ?wl.Seat = null,
+        name_buf: [16]u8 = undefined,
+        name: []const u8 = "",
+
+        fn listener(_: *Client, seat: wl.Seat, event: wl.Seat.Event, seen: *@This()) void {
+            seen.seat = seat;
+            if (event == .name) {
+                const name = event.name.name;
+                @memcpy(seen.name_buf[0..name.len], name);
+                seen.name = seen.name_buf[0..name.len];
+            }
+        }
+    };
+
+    // The same function is stored once
+    var seen0: Seen = .{};
+    var seen1: Seen = .{};
+    client.set_listener(seat0, *Seen, Seen.listener, &seen0);
+    client.set_listener(seat1, *Seen, Seen.listener, &seen1);
+    try std.testing.expectEqual(1, client.listeners.items.len);
+    try std.testing.expectEqual(client.get(seat0, .listener), client.get(seat1, .listener));
+    try std.testing.expectEqual(.none, client.get(output, .listener));
+
+    // An event reaches the listener of its object with its data, the
+    // arguments are decoded with the signature found through `interfaces`
+    var buf: [32]u8 = undefined;
+    var w = std.Io.Writer.fixed(&buf);
+    const name: Argument = .{ .string = "seat1" };
+    try name.marshal(&w);
+    const seat1_proxy: Proxy = .{ .client = &client, .id = @intFromEnum(seat1) };
+    seat1_proxy.unmarshal_event(w.buffered(), @intFromEnum(std.meta.Tag(wl.Seat.Event).name));
+    try std.testing.expectEqual(null, seen0.seat);
+    try std.testing.expectEqual(seat1, seen1.seat);
+    try std.testing.expectEqualStrings("seat1", seen1.name);
+
+    // Events of objects without a listener are dropped
+    const output_proxy: Proxy = .{ .client = &client, .id = @intFromEnum(output) };
+    output_proxy.unmarshal_event(&.{}, @intFromEnum(std.meta.Tag(wl.Output.Event).done));
+
+    // `ObjectAttrs.interface` indexes the generated table
+    for (interfaces, 0..) |interface, i| {
+        const id: InterfaceId = @enumFromInt(i);
+        try std.testing.expectEqualStrings(@tagName(id), interface.name);
+    }
+}
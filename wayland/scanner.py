@@ -192,6 +192,9 @@ class Arg:
 
     interface: str | None
     enum: str | None
+    # Looked up by `resolve`
+    interface_ref: Interface | None = field(repr=False)
+    enum_ref: tuple[Interface, Enum] | None = field(repr=False)
 
     def __init__(self, parent: Event | Request, arg: ET.Element):
         self.parent = parent
@@ -204,16 +207,32 @@ class Arg:
 
         self.interface = arg.get('interface')
         self.enum = arg.get('enum')
+        self.interface_ref = None
+        self.enum_ref = None
 
         for c in arg:
             if c.tag == 'description':
                 self.description = c.text
                 self.summary = c.get('summary') or Never
 
+    def resolve(self):
+        interface = self.parent.interface
+        protocol = interface.protocol
+        if self.interface:
+            if self.type == 'new_id':
+                self.interface_ref = protocol.interfaces[self.interface]
+            else:
+                self.interface_ref = protocol.find_interface(self.interface)
+        if self.enum:
+            # eg: wl_data_device_manager.dnd_action
+            parts = self.enum.split('.', 1)
+            owner = protocol.find_interface(parts[0]) if len(parts) == 2 else interface
+            self.enum_ref = (owner, owner.enums[parts[-1]])
+
     def zig_struct_field(self) -> ZigStruct.Field:
         if self.type == 'new_id':
-            if self.interface:
-                interface = self.parent.interface.protocol.interfaces[self.interface].zig_type()
+            if self.interface_ref:
+                interface = self.interface_ref.zig_type()
                 default = '@enumFromInt(0)'
             else:
                 interface = 'u32'
@@ -231,18 +250,12 @@ class Arg:
         protocol = self.parent.interface.protocol
         match self.type:
             case 'int' | 'uint':
-                if e := self.enum:
-                    # eg: wl_data_device_manager.dnd_action
-                    parts = e.split('.', 1)
-                    if len(parts) == 1:
-                        return title_case(self.parent.interface.enums[parts[0]].name)
-                    if len(parts) == 2:
-                        interface, enum = parts
-                        interface = protocol.interfaces[interface]
-                        enum = interface.enums[enum]
-                        return '.'.join(title_case(x) for x in [interface.name, enum.name])
-
-                    # print(parts)
+                if self.enum:
+                    assert self.enum_ref, 'unresolved'
+                    interface, enum = self.enum_ref
+                    if '.' not in self.enum:
+                        return title_case(enum.name)
+                    return '.'.join(title_case(x) for x in [interface.name, enum.name])
                 else:
                     return 'i32' if self.type == 'int' else 'u32'
 
@@ -258,11 +271,13 @@ class Arg:
                 qs = '?' if self.allow_null else ''
                 if not self.interface:
                     return qs + 'u32'
-                interface = protocol.find_interface(self.interface)
+                interface = self.interface_ref
+                assert interface, 'unresolved'
                 prefix = interface.prefix + '.' if interface.prefix != protocol.prefix else ''
                 return qs + prefix + title_case(interface.name)
             case 'array' if self.interface:
-                interface = protocol.find_interface(self.interface)
+                interface = self.interface_ref
+                assert interface, 'unresolved'
                 prefix = interface.prefix + '.' if interface.prefix != protocol.prefix else ''
                 return '[]' + prefix + title_case(interface.name)
             case 'array':
@@ -331,12 +346,11 @@ class Request:
 
         match self.type:
             case 'constructor':
-                creates_interface = next(
-                    (arg.interface for arg in self.args if arg.type == 'new_id' and arg.interface),
+                interface = next(
+                    (arg.interface_ref for arg in self.args if arg.type == 'new_id' and arg.interface_ref),
                     None,
                 )
-                if creates_interface:
-                    interface = self.interface.protocol.interfaces[creates_interface]
+                if interface:
                     return f'{title_case(interface.name)}'
                 else:
                     return '@compileError("BIND")'
@@ -517,14 +531,8 @@ class Interface:
     def zig_type(self) -> str:
         return title_case(self.name)
 
-    def find_enum(self, name: str) -> Enum:
-        parts = name.split('.')
-        if len(parts) == 1:
-            return self.enums[name]
-        if len(parts) == 2:
-            interface = self.protocol.find_interface(parts[0])
-            return interface.enums[parts[1]]
-        assert False, 'unreachable'
+    def id_name(self) -> str:
+        return f'{self.prefix}_{self.name}'
 
     def interface_impl(self) -> str:
         val = ZigStructInit(
@@ -558,7 +566,8 @@ class Interface:
                     case 'array':
                         val = f'args[{arg_i}].array.slice(u8)'
                     case 'uint' if arg.enum:
-                        enum = self.find_enum(arg.enum)
+                        assert arg.enum_ref, 'unresolved'
+                        _, enum = arg.enum_ref
                         if enum.bitfield:
                             val = f'@bitCast(args[{arg_i}].uint)'
                         else:
@@ -607,6 +616,7 @@ class Interface:
         )
 
         fd.write(self.interface_impl())
+        fd.write(f'pub const id = InterfaceId.{self.id_name()};\n')
 
         for enum in self.enums.values():
             enum.emit(fd)
@@ -696,6 +706,14 @@ class Protocol:
 
         return interface
 
+    def resolve(self):
+        """Looks up the interfaces and enums referenced by arguments for `emit`,
+        which also lists every namespace the emitted code imports in `globals`."""
+        for interface in self.interfaces.values():
+            for message in [*interface.requests.values(), *interface.events.values()]:
+                for arg in message.args:
+                    arg.resolve()
+
     def emit(self, fd: TextIO):
         emit_comment(self.copyright, fd, r'//')
 
@@ -738,6 +756,7 @@ class Namespace:
             const Argument = @import("../argument.zig").Argument;
             const Fixed = @import("../argument.zig").Fixed;
             const Client = @import("../client.zig").Client;
+            const InterfaceId = @import("interfaces.zig").InterfaceId;
 
             """
         )
@@ -753,26 +772,53 @@ class Namespace:
             )
 
 
+def emit_interface_ids(namespaces: list[Namespace], fd: TextIO):
+    """Numbers the interfaces of all namespaces densely, so objects can store a
+    u16 instead of a pointer to their `Interface`. The table holds the
+    interfaces by value, so a lookup is a single indexed load."""
+    interfaces = [i for ns in namespaces for p in ns.protocols for i in p.interfaces.values()]
+    assert len(interfaces) < 2**16
+
+    fd.write('pub const InterfaceId = enum(u16) {')
+    for i in interfaces:
+        fd.write(f'{i.id_name()},')
+    fd.write('};\n')
+
+    fd.write('/// Indexed by `InterfaceId`\n')
+    fd.write('pub const interfaces = [_]Interface{')
+    for i in interfaces:
+        fd.write(f'{i.prefix}.{i.zig_type()}.interface,')
+    fd.write('};\n')
+
+    fd.write('const Interface = @import("../proxy.zig").Interface;\n')
+    for ns in namespaces:
+        fd.write(f'const {ns.name} = @import("{ns.name}.zig");\n')
+
+
 script_dir = Path(__file__).parent
 
 
+XML_PROTOCOLS = [
+    Path('/usr/share/wayland/wayland.xml'),
+    Path('/usr/share/wayland-protocols/stable/xdg-shell/xdg-shell.xml'),
+    script_dir / 'protocols/wlr-layer-shell-unstable-v1.xml',
+    Path('/usr/share/wayland-protocols/unstable/tablet/tablet-unstable-v2.xml'),
+    Path('/usr/share/wayland-protocols/staging/cursor-shape/cursor-shape-v1.xml'),
+    Path('/usr/share/wayland-protocols/unstable/keyboard-shortcuts-inhibit/keyboard-shortcuts-inhibit-unstable-v1.xml'),
+    Path('/usr/share/wayland-protocols/unstable/xdg-decoration/xdg-decoration-unstable-v1.xml'),
+    # Path("/usr/share/wayland-protocols/stable/presentation-time/presentation-time.xml"),
+    Path('/usr/share/wayland-protocols/stable/viewporter/viewporter.xml'),
+    Path('/usr/share/wayland-protocols/staging/fractional-scale/fractional-scale-v1.xml'),
+]
+
+
 def main():
     global protocols
-    xml_protocols = [
-        '/usr/share/wayland/wayland.xml',
-        '/usr/share/wayland-protocols/stable/xdg-shell/xdg-shell.xml',
-        script_dir / 'protocols/wlr-layer-shell-unstable-v1.xml',
-        '/usr/share/wayland-protocols/unstable/tablet/tablet-unstable-v2.xml',
-        '/usr/share/wayland-protocols/staging/cursor-shape/cursor-shape-v1.xml',
-        '/usr/share/wayland-protocols/unstable/keyboard-shortcuts-inhibit/keyboard-shortcuts-inhibit-unstable-v1.xml',
-        '/usr/share/wayland-protocols/unstable/xdg-decoration/xdg-decoration-unstable-v1.xml',
-        # "/usr/share/wayland-protocols/stable/presentation-time/presentation-time.xml",
-        '/usr/share/wayland-protocols/stable/viewporter/viewporter.xml',
-        '/usr/share/wayland-protocols/staging/fractional-scale/fractional-scale-v1.xml',
-    ]
-    for p in xml_protocols:
-        p = Protocol(Path(p))
+    protocols = [Protocol(p) for p in XML_PROTOCOLS]
+    for p in protocols:
         Namespace.get(p.prefix).protocols.append(p)
+    for p in protocols:
+        p.resolve()
 
     for ns in Namespace.instances.values():
         out = script_dir / f'generated/{ns.name}.zig'
@@ -783,6 +829,11 @@ def main():
 
         subprocess.run(['zig', 'fmt', str(out)], check=True)
 
+    out = script_dir / 'generated/interfaces.zig'
+    with out.open('w') as f:
+        emit_interface_ids(list(Namespace.instances.values()), f)
+    subprocess.run(['zig', 'fmt', str(out)], check=True)
+
 
 if __name__ == '__main__':
     main()